@@ -2,10 +2,14 @@
 
 import logging
 import os
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from threading import Lock
+from typing import TYPE_CHECKING, Any
 
 from atlassian import Bitbucket
 from requests import Session
+from requests.utils import should_bypass_proxies
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.utils.auth import configure_server_pat_auth
@@ -19,6 +23,9 @@ from mcp_atlassian.utils.ssl import configure_ssl_verification
 
 from .config import BitbucketConfig
 
+if TYPE_CHECKING:
+    from mcp_atlassian.models.bitbucket import BitbucketPullRequest
+
 # Configure logging
 logger = logging.getLogger("mcp-bitbucket")
 
@@ -27,6 +34,7 @@ class BitbucketClient:
     """Base client for Bitbucket Server/Data Center API interactions."""
 
     config: BitbucketConfig
+    _bitbucket: Bitbucket
 
     def __init__(self, config: BitbucketConfig | None = None) -> None:
         """Initialize the Bitbucket client with configuration options.
@@ -42,53 +50,69 @@ class BitbucketClient:
         self.config = config or BitbucketConfig.from_env()
 
         # Initialize the Bitbucket client based on auth type
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         if self.config.auth_type == "pat":
-            logger.debug(
-                f"Initializing Bitbucket client with PAT auth. "
-                f"URL: {self.config.url}, "
-                f"Token (masked): {mask_sensitive(str(self.config.personal_token))}"
-            )
+            if debug_enabled:
+                logger.debug(
+                    f"Initializing Bitbucket client with PAT auth. "
+                    f"URL: {self.config.url}, "
+                    f"Token (masked): {mask_sensitive(str(self.config.personal_token))}"
+                )
 
             # Server/DC instances need Bearer authentication for PATs
             session = Session()
             configure_server_pat_auth(session, self.config.personal_token)
 
             # Initialize Bitbucket with the pre-configured session
-            self.bitbucket = Bitbucket(
+            self._bitbucket = Bitbucket(
                 url=self.config.url,
                 session=session,
                 cloud=False,
             )
 
-            logger.debug(
-                f"Bitbucket Server/DC client initialized with Bearer auth. "
-                f"Session headers (Authorization masked): "
-                f"{get_masked_session_headers(dict(self.bitbucket._session.headers))}"
-            )
+            if debug_enabled:
+                logger.debug(
+                    f"Bitbucket Server/DC client initialized with Bearer auth. "
+                    f"Session headers (Authorization masked): "
+                    f"{get_masked_session_headers(dict(self._bitbucket._session.headers))}"
+                )
         else:  # basic auth
             logger.debug(
                 f"Initializing Bitbucket client with Basic auth. "
                 f"URL: {self.config.url}, Username: {self.config.username}, "
                 f"API Token present: {bool(self.config.api_token)}"
             )
-            self.bitbucket = Bitbucket(
+            self._bitbucket = Bitbucket(
                 url=self.config.url,
                 username=self.config.username,
                 password=self.config.api_token,
                 cloud=False,
             )
-            headers = get_masked_session_headers(dict(self.bitbucket._session.headers))
-            logger.debug(f"Bitbucket client initialized. Headers: {headers}")
+            if debug_enabled:
+                headers = get_masked_session_headers(
+                    dict(self._bitbucket._session.headers)
+                )
+                logger.debug(f"Bitbucket client initialized. Headers: {headers}")
 
         # Configure SSL verification
         configure_ssl_verification(
             service_name="Bitbucket",
             url=self.config.url,
-            session=self.bitbucket._session,
+            session=self._bitbucket._session,
             ssl_verify=self.config.ssl_verify,
         )
 
-        # Proxy configuration
+        # Proxy configuration. The session ignores proxy environment variables
+        # (trust_env=False) so NO_PROXY is no longer written to os.environ and
+        # other clients in the process are unaffected; env proxies are already
+        # promoted to config by BitbucketConfig.from_env.
+        session = self._bitbucket._session
+        session.trust_env = False
+        if session.verify is True:
+            # Keep honouring CA bundle env vars that trust_env would have read
+            ca_bundle = os.getenv("REQUESTS_CA_BUNDLE") or os.getenv("CURL_CA_BUNDLE")
+            if ca_bundle:
+                session.verify = ca_bundle
         proxies = {}
         if self.config.http_proxy:
             proxies["http"] = self.config.http_proxy
@@ -96,58 +120,110 @@ class BitbucketClient:
             proxies["https"] = self.config.https_proxy
         if self.config.socks_proxy:
             proxies["socks"] = self.config.socks_proxy
-        if proxies:
-            self.bitbucket._session.proxies.update(proxies)
-            for k, v in proxies.items():
-                log_config_param(
-                    logger, "Bitbucket", f"{k.upper()}_PROXY", v, sensitive=True
-                )
         if self.config.no_proxy and isinstance(self.config.no_proxy, str):
-            os.environ["NO_PROXY"] = self.config.no_proxy
             log_config_param(logger, "Bitbucket", "NO_PROXY", self.config.no_proxy)
+            # The client only talks to config.url, so resolve the bypass once
+            if proxies and should_bypass_proxies(
+                self.config.url, no_proxy=self.config.no_proxy
+            ):
+                proxies = {}
+            proxies["no_proxy"] = self.config.no_proxy
+        if proxies:
+            session.proxies.update(proxies)
+            for k, v in proxies.items():
+                if k != "no_proxy":
+                    log_config_param(
+                        logger, "Bitbucket", f"{k.upper()}_PROXY", v, sensitive=True
+                    )
 
-        # Configure rate limiting
-        configure_rate_limiting(self.bitbucket._session, "bitbucket")
+        # Configure rate limiting; the rate-limited adapter also owns the
+        # connection pool, so size it for bursts of composite tool calls
+        configure_rate_limiting(
+            self._bitbucket._session,
+            "bitbucket",
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+        )
         logger.debug("Rate limiting configured for Bitbucket session")
 
         # Apply custom headers if configured
         if self.config.custom_headers:
             self._apply_custom_headers()
 
-        # Test authentication during initialization (in debug mode only)
-        if logger.isEnabledFor(logging.DEBUG):
+        # Authentication is tested lazily on first use (in debug mode only)
+        self._auth_validated = False
+        self._auth_validation_lock = Lock()
+
+    @property
+    def bitbucket(self) -> Bitbucket:
+        """The underlying Bitbucket API client.
+
+        The first access triggers the debug-mode authentication check.
+        """
+        if not self._auth_validated:
+            self._ensure_validated()
+        return self._bitbucket
+
+    @bitbucket.setter
+    def bitbucket(self, value: Bitbucket) -> None:
+        self._bitbucket = value
+
+    def _ensure_validated(self) -> None:
+        """Run the debug-mode authentication check once per client."""
+        with self._auth_validation_lock:
+            if self._auth_validated:
+                return
+            # Mark first so the check itself can use the client
+            self._auth_validated = True
+            if not logger.isEnabledFor(logging.DEBUG):
+                return
             try:
                 self._validate_authentication()
             except MCPAtlassianAuthenticationError:
                 logger.warning(
-                    "Authentication validation failed during client initialization - "
-                    "continuing anyway"
+                    "Authentication validation failed on first use - continuing anyway"
                 )
 
     def _validate_authentication(self) -> None:
         """Validate authentication by making a simple API call."""
         try:
-            logger.debug("Testing Bitbucket authentication by retrieving projects...")
-            # Use project_list as a simple auth check
-            projects = list(self.bitbucket.project_list(limit=1))
-            if projects is not None:
-                logger.info(
-                    f"Bitbucket authentication successful. "
-                    f"Found {len(projects)} project(s) accessible."
-                )
-            else:
-                logger.warning(
-                    "Bitbucket authentication test returned empty response - "
-                    "this may indicate an issue"
-                )
+            logger.debug(
+                "Testing Bitbucket authentication via application-properties..."
+            )
+            # application-properties is cheap server-side; only the status matters
+            response = self.bitbucket._session.get(
+                f"{self.config.url.rstrip('/')}/rest/api/1.0/application-properties",
+                timeout=5,
+            )
+            status_code = response.status_code
         except Exception as e:
             error_msg = f"Bitbucket authentication validation failed: {e}"
             logger.error(error_msg)
+            self._log_auth_failure_headers()
+            raise MCPAtlassianAuthenticationError(error_msg) from e
+
+        if status_code == 200:
+            logger.info("Bitbucket authentication successful.")
+        elif status_code in (401, 403):
+            error_msg = (
+                f"Bitbucket authentication validation failed: HTTP {status_code}"
+            )
+            logger.error(error_msg)
+            self._log_auth_failure_headers()
+            raise MCPAtlassianAuthenticationError(error_msg)
+        else:
+            logger.warning(
+                f"Bitbucket authentication test returned HTTP {status_code} - "
+                "this may indicate an issue"
+            )
+
+    def _log_auth_failure_headers(self) -> None:
+        """Log the masked session headers after a failed auth check."""
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Authentication headers during failure: "
                 f"{get_masked_session_headers(dict(self.bitbucket._session.headers))}"
             )
-            raise MCPAtlassianAuthenticationError(error_msg) from e
 
     def _apply_custom_headers(self) -> None:
         """Apply custom headers to the Bitbucket session."""
@@ -157,15 +233,15 @@ class BitbucketClient:
         header_count = len(self.config.custom_headers)
         logger.debug(f"Applying {header_count} custom headers to Bitbucket session")
         for header_name, header_value in self.config.custom_headers.items():
-            self.bitbucket._session.headers[header_name] = header_value
+            self._bitbucket._session.headers[header_name] = header_value
             logger.debug(f"Applied custom header: {header_name}")
 
     def _get_paged_results(
         self,
-        fetch_func,
+        fetch_func: Callable[..., Iterable[Any]],
         limit: int | None = None,
         start: int = 0,
-        **kwargs,
+        **kwargs: Any,
     ) -> list[Any]:
         """Helper to collect all results from a paged Bitbucket API call.
 
@@ -178,9 +254,47 @@ class BitbucketClient:
         Returns:
             List of all results
         """
-        results = []
-        for item in fetch_func(start=start, limit=limit, **kwargs):
-            results.append(item)
-            if limit and len(results) >= limit:
-                break
-        return results
+        return list(
+            self._get_paged_iter(fetch_func, limit=limit, start=start, **kwargs)
+        )
+
+    def _get_paged_iter(
+        self,
+        fetch_func: Callable[..., Iterable[Any]],
+        limit: int | None = None,
+        start: int = 0,
+        page_size: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Helper to lazily yield results from a paged Bitbucket API call.
+
+        Nothing is accumulated, so callers that stop iterating early avoid
+        requesting the remaining pages.
+
+        Args:
+            fetch_func: The function to call that returns paged results
+            limit: Maximum number of results to yield
+            start: Starting index for pagination
+            page_size: Number of results to request per page (defaults to limit)
+            **kwargs: Additional arguments to pass to the fetch function
+
+        Yields:
+            Individual results
+        """
+        items = fetch_func(start=start, limit=page_size or limit, **kwargs)
+        if limit:
+            items = islice(items, limit)
+        yield from items
+
+    if TYPE_CHECKING:
+        # Implemented by PullRequestsMixin; declared here so that mixin
+        # methods typed with a BitbucketClient self can call it
+        def get_pull_requests_iter(
+            self,
+            project_key: str,
+            repository_slug: str,
+            state: str = "OPEN",
+            order: str = "newest",
+            limit: int | None = None,
+            start: int = 0,
+        ) -> Iterator["BitbucketPullRequest"]: ...
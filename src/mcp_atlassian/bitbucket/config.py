@@ -5,7 +5,22 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
-from ..utils.env import get_custom_headers, is_env_ssl_verify
+from ..utils.env import get_custom_headers, get_env_positive_int, is_env_ssl_verify
+
+
+def _get_proxy_env(name: str) -> str | None:
+    """Read a proxy variable, preferring the BITBUCKET_ override.
+
+    Falls back to the global variable, with the lower-case spelling taking
+    precedence over the upper-case one as it does in urllib and requests.
+
+    Args:
+        name: Upper-case variable name, e.g. "HTTPS_PROXY"
+
+    Returns:
+        The proxy setting, or None if no variant is set
+    """
+    return os.getenv(f"BITBUCKET_{name}", os.getenv(name.lower(), os.getenv(name)))
 
 
 @dataclass
@@ -29,6 +44,8 @@ class BitbucketConfig:
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
     custom_headers: dict[str, str] | None = None  # Custom HTTP headers
+    pool_connections: int = 32  # Number of connection pools to cache
+    pool_maxsize: int = 64  # Maximum connections kept alive per pool
 
     @classmethod
     def from_env(cls) -> "BitbucketConfig":
@@ -70,15 +87,21 @@ class BitbucketConfig:
         # Get the projects filter if provided
         projects_filter = os.getenv("BITBUCKET_PROJECTS_FILTER")
 
-        # Proxy settings
-        http_proxy = os.getenv("BITBUCKET_HTTP_PROXY", os.getenv("HTTP_PROXY"))
-        https_proxy = os.getenv("BITBUCKET_HTTPS_PROXY", os.getenv("HTTPS_PROXY"))
-        no_proxy = os.getenv("BITBUCKET_NO_PROXY", os.getenv("NO_PROXY"))
-        socks_proxy = os.getenv("BITBUCKET_SOCKS_PROXY", os.getenv("SOCKS_PROXY"))
+        # Proxy settings. The client session does not read the environment
+        # (trust_env=False), so the lower-case variants requests would have
+        # honoured are promoted here too
+        http_proxy = _get_proxy_env("HTTP_PROXY")
+        https_proxy = _get_proxy_env("HTTPS_PROXY")
+        no_proxy = _get_proxy_env("NO_PROXY")
+        socks_proxy = _get_proxy_env("SOCKS_PROXY")
 
         # Custom headers - service-specific only
         custom_headers = get_custom_headers("BITBUCKET_CUSTOM_HEADERS")
 
+        # Connection pool sizing
+        pool_connections = get_env_positive_int("BITBUCKET_POOL_CONNECTIONS", 32)
+        pool_maxsize = get_env_positive_int("BITBUCKET_POOL_MAXSIZE", 64)
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -92,6 +115,8 @@ class BitbucketConfig:
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
             custom_headers=custom_headers,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
         )
 
     def is_auth_configured(self) -> bool:
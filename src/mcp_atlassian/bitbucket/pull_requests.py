@@ -1,6 +1,7 @@
 """Pull requests mixin for Bitbucket client."""
 
 import logging
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 from mcp_atlassian.models.bitbucket import BitbucketComment, BitbucketPullRequest
@@ -36,30 +37,60 @@ class PullRequestsMixin:
         Returns:
             List of BitbucketPullRequest objects
         """
-        pull_requests = []
-
-        try:
-            for pr_data in self.bitbucket.get_pull_requests(
+        return list(
+            self.get_pull_requests_iter(
                 project_key,
                 repository_slug,
                 state=state,
                 order=order,
+                limit=limit,
                 start=start,
-                limit=limit or 100,
-            ):
-                pr = BitbucketPullRequest.from_api_response(pr_data)
-                pull_requests.append(pr)
+            )
+        )
 
-                if limit and len(pull_requests) >= limit:
-                    break
+    def get_pull_requests_iter(
+        self: "BitbucketClient",
+        project_key: str,
+        repository_slug: str,
+        state: str = "OPEN",
+        order: str = "newest",
+        limit: int | None = None,
+        start: int = 0,
+    ) -> Iterator[BitbucketPullRequest]:
+        """Lazily yield pull requests for a repository.
+
+        Pages are only requested as the caller advances, so breaking out of
+        the loop early avoids fetching the remaining pages.
+
+        Args:
+            project_key: The project key
+            repository_slug: The repository slug
+            state: Filter by state (OPEN, MERGED, DECLINED, ALL)
+            order: Order by (newest, oldest)
+            limit: Maximum number of pull requests to yield
+            start: Starting index for pagination
+
+        Yields:
+            BitbucketPullRequest objects
+        """
+        try:
+            for pr_data in self._get_paged_iter(
+                self.bitbucket.get_pull_requests,
+                limit=limit,
+                start=start,
+                project_key=project_key,
+                repository_slug=repository_slug,
+                state=state,
+                order=order,
+                page_size=limit or 100,
+            ):
+                yield BitbucketPullRequest.from_api_response(pr_data)
         except Exception as e:
             logger.error(
                 f"Error fetching pull requests for {project_key}/{repository_slug}: {e}"
             )
             raise
 
-        return pull_requests
-
     def get_pull_request(
         self: "BitbucketClient",
         project_key: str,
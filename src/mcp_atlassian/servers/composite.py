@@ -2,55 +2,366 @@
 
 import json
 import logging
-from typing import Annotated, Any
-
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Annotated, Any, NamedTuple, TypeVar
+
+import anyio
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
+from mcp_atlassian.bitbucket import BitbucketFetcher
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.models.jira import JiraIssue
 from mcp_atlassian.servers.dependencies import get_bitbucket_fetcher, get_jira_fetcher
 from mcp_atlassian.utils.jira_keys import (
+    JiraKeyMatch,
     extract_jira_keys,
     parse_development_identifier,
 )
 
 logger = logging.getLogger("mcp-atlassian.composite")
 
+T = TypeVar("T")
+
 composite_mcp = FastMCP(
     name="Atlassian Composite",
     instructions="Provides composite tools that combine data from multiple Atlassian services (Jira, Bitbucket).",
 )
 
 
-@composite_mcp.tool(tags={"composite", "jira", "bitbucket", "read"})
-async def get_issue_with_development_context(
-    ctx: Context,
-    issue_key: Annotated[str, Field(description="Jira issue key (e.g., 'PROJ-123')")],
-    include_pr_details: Annotated[
-        bool,
-        Field(
-            description="Whether to include detailed PR information",
-            default=True,
-        ),
-    ] = True,
-    include_pr_diff_summary: Annotated[
-        bool,
-        Field(
-            description="Whether to include PR diff summaries (can be large)",
-            default=False,
-        ),
-    ] = False,
-    bitbucket_project_key: Annotated[
-        str | None,
-        Field(
-            description="Optional Bitbucket project to search for PRs if development info is unavailable",
-            default=None,
-        ),
-    ] = None,
-) -> str:
-    """Get Jira issue with linked PRs, branches, and commits.
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result as indented JSON."""
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
-    This tool combines Jira issue data with development information from
-    linked source control systems (Bitbucket, GitHub, GitLab).
+
+async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking fetcher call in a worker thread.
+
+    The fetchers use synchronous ``requests`` sessions, so calling them
+    directly from a tool would stall the event loop for every round-trip.
+    anyio keeps this usable from whichever backend runs the server.
+    """
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+
+# Maximum number of repositories scanned concurrently for linked PRs
+_MAX_CONCURRENT_REPO_SCANS = 8
+
+# Maximum number of linked Jira issues fetched concurrently
+_MAX_CONCURRENT_ISSUE_FETCHES = 8
+
+# Fields fetched for Jira issues linked from a PR
+_LINKED_ISSUE_FIELDS = [
+    "summary",
+    "status",
+    "issuetype",
+    "priority",
+    "assignee",
+    "reporter",
+]
+
+# Expansion requested for a full Jira issue. A full fetch (all fields plus
+# this expansion) also covers every field in _LINKED_ISSUE_FIELDS.
+_FULL_ISSUE_EXPAND = "names,renderedFields"
+
+
+def _get_full_issue(
+    jira: JiraFetcher,
+    issue_key: str,
+    issue_memo: dict[str, JiraIssue] | None = None,
+) -> JiraIssue:
+    """Fetch a Jira issue with all fields, reusing one fetched in this call.
+
+    The memo only lives for a single tool invocation, so an issue is fetched
+    once per resolve tree but never served stale across calls.
+
+    Args:
+        jira: The Jira fetcher to use.
+        issue_key: Jira issue key.
+        issue_memo: Optional per-invocation memo of fully fetched issues.
+
+    Returns:
+        The Jira issue.
+    """
+    if issue_memo is not None and issue_key in issue_memo:
+        return issue_memo[issue_key]
+
+    issue = jira.get_issue(
+        issue_key=issue_key,
+        fields=None,  # Get all fields
+        expand=_FULL_ISSUE_EXPAND,
+    )
+    if issue_memo is not None:
+        issue_memo[issue_key] = issue
+    return issue
+
+
+@lru_cache(maxsize=1024)
+def _extract_pr_jira_keys(
+    title: str | None, description: str | None, branch_name: str | None
+) -> tuple[JiraKeyMatch, ...]:
+    """Extract Jira keys from PR fields, memoized across composite calls."""
+    return tuple(
+        extract_jira_keys(
+            title=title,
+            description=description,
+            branch_name=branch_name,
+        )
+    )
+
+
+class _PRFields(NamedTuple):
+    """PR fields read by the repo scan, bound once per PR."""
+
+    id: Any
+    title: str
+    description: str
+    state: Any
+    author: Any
+    source_branch: str
+    target_branch: Any
+    url: Any
+
+    @classmethod
+    def from_dict(cls, pr_dict: dict[str, Any]) -> "_PRFields":
+        """Build from a simplified PR dict, defaulting text fields to ''."""
+        get = pr_dict.get
+        return cls(
+            get("id"),
+            get("title", ""),
+            get("description", ""),
+            get("state"),
+            get("author"),
+            get("source_branch", ""),
+            get("target_branch"),
+            get("url"),
+        )
+
+
+@dataclass(slots=True)
+class _PRInfo:
+    """A PR found by the repo scan, converted to a dict only for output."""
+
+    project_key: str
+    repository_slug: str
+    id: Any
+    title: str
+    state: Any
+    author: Any
+    source_branch: str
+    target_branch: Any
+    url: Any
+    changes_summary: Any = None
+    changes_error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the PR info dict returned by the composite tools."""
+        pr_info = {
+            "project_key": self.project_key,
+            "repository_slug": self.repository_slug,
+            "id": self.id,
+            "title": self.title,
+            "state": self.state,
+            "author": self.author,
+            "source_branch": self.source_branch,
+            "target_branch": self.target_branch,
+            "url": self.url,
+        }
+        if self.changes_summary is not None:
+            pr_info["changes_summary"] = self.changes_summary
+        if self.changes_error is not None:
+            pr_info["changes_error"] = self.changes_error
+        return pr_info
+
+
+def _scan_repo_for_issue(
+    bitbucket: BitbucketFetcher,
+    project_key: str,
+    repo_slug: str,
+    issue_key: str,
+    include_pr_diff_summary: bool,
+    max_prs: int | None = None,
+    stop_event: threading.Event | None = None,
+) -> list[_PRInfo]:
+    """Find PRs in a single repository that mention a Jira issue key.
+
+    This is a blocking helper meant to be run in an executor so multiple
+    repositories can be scanned concurrently.
+
+    Args:
+        bitbucket: The Bitbucket fetcher to use.
+        project_key: Bitbucket project key.
+        repo_slug: Repository slug to scan.
+        issue_key: Jira issue key to look for.
+        include_pr_diff_summary: Whether to include PR diff summaries.
+        max_prs: Optional number of matching PRs after which to stop scanning.
+        stop_event: Optional event, checked between PRs, that ends the scan
+            early once other repositories have found enough PRs.
+
+    Returns:
+        List of PR infos for PRs mentioning the issue.
+    """
+    pr_infos: list[_PRInfo] = []
+    upper_key = issue_key.upper()
+    key_pattern = re.compile(re.escape(upper_key), re.IGNORECASE)
+
+    # Stream PRs and check for issue key in title/description; pages are only
+    # fetched as the loop advances, so reaching max_prs stops pagination
+    prs = bitbucket.get_pull_requests_iter(
+        project_key,
+        repo_slug,
+        state="ALL",
+        limit=50,
+    )
+
+    for pr in prs:
+        if stop_event is not None and stop_event.is_set():
+            break
+        pr_fields = _PRFields.from_dict(pr.to_simplified_dict())
+
+        # Cheap case-insensitive search rules out most PRs before running the
+        # extractor, without an upper-cased copy of each description
+        haystack = (
+            f"{pr_fields.title or ''}\n{pr_fields.description or ''}\n"
+            f"{pr_fields.source_branch or ''}"
+        )
+        if key_pattern.search(haystack) is None:
+            continue
+
+        # Check if this PR mentions the issue
+        extracted_keys = frozenset(
+            m.key
+            for m in _extract_pr_jira_keys(
+                pr_fields.title, pr_fields.description, pr_fields.source_branch
+            )
+        )
+
+        if upper_key in extracted_keys:
+            pr_info = _PRInfo(
+                project_key=project_key,
+                repository_slug=repo_slug,
+                id=pr_fields.id,
+                title=pr_fields.title,
+                state=pr_fields.state,
+                author=pr_fields.author,
+                source_branch=pr_fields.source_branch,
+                target_branch=pr_fields.target_branch,
+                url=pr_fields.url,
+            )
+
+            # Optionally include diff summary
+            if include_pr_diff_summary:
+                try:
+                    pr_info.changes_summary = bitbucket.get_pull_request_changes(
+                        project_key,
+                        repo_slug,
+                        pr_fields.id,
+                    )
+                except Exception as diff_err:
+                    pr_info.changes_error = str(diff_err)
+
+            pr_infos.append(pr_info)
+            if max_prs and len(pr_infos) >= max_prs:
+                break
+
+    return pr_infos
+
+
+async def _scan_repos_for_issue(
+    bitbucket: BitbucketFetcher,
+    project_key: str,
+    repo_slugs: list[str],
+    issue_key: str,
+    include_pr_diff_summary: bool,
+    max_prs: int | None = None,
+) -> list[_PRInfo]:
+    """Scan repositories concurrently for PRs that mention a Jira issue key.
+
+    Args:
+        bitbucket: The Bitbucket fetcher to use.
+        project_key: Bitbucket project key.
+        repo_slugs: Repository slugs to scan.
+        issue_key: Jira issue key to look for.
+        include_pr_diff_summary: Whether to include PR diff summaries.
+        max_prs: Optional number of matching PRs to return. Once the repos
+            scanned so far, taken in order, already hold this many, the scans
+            of later repos are cancelled; the result is the same as a full
+            sequential scan truncated to ``max_prs``.
+
+    Returns:
+        List of PR infos in repository order.
+    """
+    limiter = anyio.CapacityLimiter(_MAX_CONCURRENT_REPO_SCANS)
+    stop_event = threading.Event()
+    # PRs per finished scan; a failed scan settles with no PRs
+    scan_results: dict[str, list[_PRInfo]] = {}
+    # Repos at the front of repo_slugs whose scans have all settled, and the
+    # number of PRs they found
+    settled_prefix = 0
+    prefix_found = 0
+
+    async def scan(repo_slug: str) -> None:
+        nonlocal settled_prefix, prefix_found
+        try:
+            async with limiter:
+                repo_prs = await _run_blocking(
+                    _scan_repo_for_issue,
+                    bitbucket,
+                    project_key,
+                    repo_slug,
+                    issue_key,
+                    include_pr_diff_summary,
+                    max_prs,
+                    stop_event,
+                )
+        except Exception as scan_error:
+            logger.debug(
+                f"Failed to search PRs in {project_key}/{repo_slug}: {scan_error}"
+            )
+            repo_prs = []
+        scan_results[repo_slug] = repo_prs
+        if not max_prs:
+            return
+        while (
+            settled_prefix < len(repo_slugs)
+            and repo_slugs[settled_prefix] in scan_results
+        ):
+            prefix_found += len(scan_results[repo_slugs[settled_prefix]])
+            settled_prefix += 1
+        if prefix_found >= max_prs:
+            # Only repos after the settled prefix are still running, and none
+            # of their PRs can make the cut. Worker threads cannot be
+            # cancelled, so signal them to stop paginating and cancel the
+            # scans still waiting for a slot
+            stop_event.set()
+            task_group.cancel_scope.cancel()
+
+    async with anyio.create_task_group() as task_group:
+        for repo_slug in repo_slugs:
+            task_group.start_soon(scan, repo_slug)
+
+    pr_infos = [
+        pr_info
+        for repo_slug in repo_slugs
+        for pr_info in scan_results.get(repo_slug, [])
+    ]
+    return pr_infos[:max_prs] if max_prs else pr_infos
+
+
+async def _build_issue_development_context(
+    ctx: Context,
+    issue_key: str,
+    include_pr_details: bool = True,
+    include_pr_diff_summary: bool = False,
+    bitbucket_project_key: str | None = None,
+    max_prs: int | None = None,
+    issue_memo: dict[str, JiraIssue] | None = None,
+) -> dict[str, Any]:
+    """Build the development context result for a Jira issue.
 
     Args:
         ctx: The FastMCP context.
@@ -58,9 +369,11 @@ async def get_issue_with_development_context(
         include_pr_details: Whether to include PR details
         include_pr_diff_summary: Whether to include PR diff summaries
         bitbucket_project_key: Optional Bitbucket project to search in
+        max_prs: Optional limit on PRs found by the Bitbucket search
+        issue_memo: Optional memo of issues already fetched in this call
 
     Returns:
-        JSON with issue data and development context.
+        Dictionary with issue data and development context.
     """
     result: dict[str, Any] = {
         "issue_key": issue_key,
@@ -75,25 +388,23 @@ async def get_issue_with_development_context(
         jira = await get_jira_fetcher(ctx)
     except ValueError as e:
         result["errors"].append(f"Jira not available: {str(e)}")
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return result
 
     # Fetch the Jira issue
     try:
-        issue = jira.get_issue(
-            issue_key=issue_key,
-            fields=None,  # Get all fields
-            expand="names,renderedFields",
-        )
+        issue = await _run_blocking(_get_full_issue, jira, issue_key, issue_memo)
         result["issue"] = issue.to_simplified_dict()
     except Exception as e:
         logger.error(f"Failed to fetch Jira issue {issue_key}: {e}")
         result["errors"].append(f"Failed to fetch issue: {str(e)}")
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return result
 
     # Try to get development info from Jira
     dev_info_available = False
     try:
-        dev_info = jira.get_development_information(issue_key=issue_key)
+        dev_info = await _run_blocking(
+            jira.get_development_information, issue_key=issue_key
+        )
         dev_info_dict = dev_info.to_dict()
         result["development_info"] = dev_info_dict
 
@@ -114,63 +425,19 @@ async def get_issue_with_development_context(
         try:
             bitbucket = await get_bitbucket_fetcher(ctx)
             # Search for PRs mentioning this issue key
-            repos = bitbucket.get_repositories(bitbucket_project_key)
-
-            for repo in repos:
-                repo_slug = repo.slug
-                try:
-                    # Get open PRs and check for issue key in title/description
-                    prs = bitbucket.get_pull_requests(
-                        bitbucket_project_key,
-                        repo_slug,
-                        state="ALL",
-                        limit=50,
-                    )
+            repos = await _run_blocking(
+                bitbucket.get_repositories, bitbucket_project_key
+            )
 
-                    for pr in prs:
-                        pr_dict = pr.to_simplified_dict()
-                        title = pr_dict.get("title", "")
-                        description = pr_dict.get("description", "")
-                        source_branch = pr_dict.get("source_branch", "")
-
-                        # Check if this PR mentions the issue
-                        extracted_keys = extract_jira_keys(
-                            title=title,
-                            description=description,
-                            branch_name=source_branch,
-                        )
-
-                        if any(m.key == issue_key.upper() for m in extracted_keys):
-                            pr_info = {
-                                "project_key": bitbucket_project_key,
-                                "repository_slug": repo_slug,
-                                "id": pr_dict.get("id"),
-                                "title": title,
-                                "state": pr_dict.get("state"),
-                                "author": pr_dict.get("author"),
-                                "source_branch": source_branch,
-                                "target_branch": pr_dict.get("target_branch"),
-                                "url": pr_dict.get("url"),
-                            }
-
-                            # Optionally include diff summary
-                            if include_pr_diff_summary:
-                                try:
-                                    changes = bitbucket.get_pull_request_changes(
-                                        bitbucket_project_key,
-                                        repo_slug,
-                                        pr_dict.get("id"),
-                                    )
-                                    pr_info["changes_summary"] = changes
-                                except Exception as diff_err:
-                                    pr_info["changes_error"] = str(diff_err)
-
-                            result["pull_requests"].append(pr_info)
-
-                except Exception as repo_err:
-                    logger.debug(
-                        f"Failed to search PRs in {bitbucket_project_key}/{repo_slug}: {repo_err}"
-                    )
+            pr_infos = await _scan_repos_for_issue(
+                bitbucket,
+                bitbucket_project_key,
+                [repo.slug for repo in repos],
+                issue_key,
+                include_pr_diff_summary,
+                max_prs=max_prs,
+            )
+            result["pull_requests"].extend(pr_info.to_dict() for pr_info in pr_infos)
 
         except ValueError as e:
             result["errors"].append(f"Bitbucket search failed: {str(e)}")
@@ -186,28 +453,83 @@ async def get_issue_with_development_context(
         "error_count": len(result["errors"]),
     }
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return result
 
 
-@composite_mcp.tool(tags={"composite", "bitbucket", "jira", "read"})
-async def get_pr_with_jira_context(
+@composite_mcp.tool(tags={"composite", "jira", "bitbucket", "read"})
+async def get_issue_with_development_context(
     ctx: Context,
-    project_key: Annotated[str, Field(description="Bitbucket project key")],
-    repository_slug: Annotated[str, Field(description="Repository slug")],
-    pull_request_id: Annotated[int, Field(description="PR ID")],
-    resolve_jira_issues: Annotated[
+    issue_key: Annotated[str, Field(description="Jira issue key (e.g., 'PROJ-123')")],
+    include_pr_details: Annotated[
         bool,
         Field(
-            description="Whether to resolve linked Jira issues",
+            description="Whether to include detailed PR information",
             default=True,
         ),
     ] = True,
+    include_pr_diff_summary: Annotated[
+        bool,
+        Field(
+            description="Whether to include PR diff summaries (can be large)",
+            default=False,
+        ),
+    ] = False,
+    bitbucket_project_key: Annotated[
+        str | None,
+        Field(
+            description="Optional Bitbucket project to search for PRs if development info is unavailable",
+            default=None,
+        ),
+    ] = None,
+    max_prs: Annotated[
+        int | None,
+        Field(
+            description=(
+                "Optional maximum number of PRs to return from the Bitbucket "
+                "search; scanning stops once reached"
+            ),
+            default=None,
+            ge=1,
+        ),
+    ] = None,
 ) -> str:
-    """Get Bitbucket PR with linked Jira issue details.
+    """Get Jira issue with linked PRs, branches, and commits.
 
-    This tool fetches a Bitbucket pull request and automatically extracts
-    and resolves any Jira issue keys found in the PR title, description,
-    or source branch name.
+    This tool combines Jira issue data with development information from
+    linked source control systems (Bitbucket, GitHub, GitLab).
+
+    Args:
+        ctx: The FastMCP context.
+        issue_key: Jira issue key (e.g., 'PROJ-123')
+        include_pr_details: Whether to include PR details
+        include_pr_diff_summary: Whether to include PR diff summaries
+        bitbucket_project_key: Optional Bitbucket project to search in
+        max_prs: Optional limit on PRs found by the Bitbucket search
+
+    Returns:
+        JSON with issue data and development context.
+    """
+    return _dumps(
+        await _build_issue_development_context(
+            ctx,
+            issue_key,
+            include_pr_details=include_pr_details,
+            include_pr_diff_summary=include_pr_diff_summary,
+            bitbucket_project_key=bitbucket_project_key,
+            max_prs=max_prs,
+        )
+    )
+
+
+async def _build_pr_jira_context(
+    ctx: Context,
+    project_key: str,
+    repository_slug: str,
+    pull_request_id: int,
+    resolve_jira_issues: bool = True,
+    issue_memo: dict[str, JiraIssue] | None = None,
+) -> dict[str, Any]:
+    """Build the Jira context result for a Bitbucket pull request.
 
     Args:
         ctx: The FastMCP context.
@@ -215,9 +537,11 @@ async def get_pr_with_jira_context(
         repository_slug: Repository slug
         pull_request_id: PR ID
         resolve_jira_issues: Whether to resolve linked Jira issues
+        issue_memo: Optional memo of issues fetched in this call. When given,
+            linked issues are fetched in full so later lookups can reuse them.
 
     Returns:
-        JSON with PR data and resolved Jira issues.
+        Dictionary with PR data and resolved Jira issues.
     """
     result: dict[str, Any] = {
         "pull_request": None,
@@ -231,11 +555,13 @@ async def get_pr_with_jira_context(
         bitbucket = await get_bitbucket_fetcher(ctx)
     except ValueError as e:
         result["errors"].append(f"Bitbucket not available: {str(e)}")
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return result
 
     # Fetch the PR
     try:
-        pr = bitbucket.get_pull_request(project_key, repository_slug, pull_request_id)
+        pr = await _run_blocking(
+            bitbucket.get_pull_request, project_key, repository_slug, pull_request_id
+        )
         pr_dict = pr.to_simplified_dict()
         result["pull_request"] = pr_dict
     except Exception as e:
@@ -243,18 +569,14 @@ async def get_pr_with_jira_context(
             f"Failed to fetch PR {project_key}/{repository_slug}#{pull_request_id}: {e}"
         )
         result["errors"].append(f"Failed to fetch PR: {str(e)}")
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return result
 
     # Extract Jira keys from PR
     title = pr_dict.get("title", "")
     description = pr_dict.get("description", "")
     source_branch = pr_dict.get("source_branch", "")
 
-    jira_matches = extract_jira_keys(
-        title=title,
-        description=description,
-        branch_name=source_branch,
-    )
+    jira_matches = _extract_pr_jira_keys(title, description, source_branch)
 
     result["jira_key_matches"] = [
         {"key": m.key, "source": m.source, "confidence": m.confidence}
@@ -266,38 +588,51 @@ async def get_pr_with_jira_context(
         try:
             jira = await get_jira_fetcher(ctx)
 
-            for match in jira_matches:
-                try:
+            limiter = anyio.CapacityLimiter(_MAX_CONCURRENT_ISSUE_FETCHES)
+            issues: list[dict[str, Any] | Exception | None] = [None] * len(jira_matches)
+
+            def load(issue_key: str) -> dict[str, Any]:
+                if issue_memo is not None:
+                    issue = _get_full_issue(jira, issue_key, issue_memo)
+                else:
                     issue = jira.get_issue(
-                        issue_key=match.key,
-                        fields=[
-                            "summary",
-                            "status",
-                            "issuetype",
-                            "priority",
-                            "assignee",
-                            "reporter",
-                        ],
+                        issue_key=issue_key, fields=_LINKED_ISSUE_FIELDS
                     )
-                    issue_dict = issue.to_simplified_dict()
-                    result["linked_jira_issues"].append(
-                        {
-                            "key": match.key,
-                            "source": match.source,
-                            "confidence": match.confidence,
-                            "issue": issue_dict,
-                        }
+                return issue.to_simplified_dict()
+
+            async def fetch(index: int, issue_key: str) -> None:
+                try:
+                    async with limiter:
+                        issues[index] = await _run_blocking(load, issue_key)
+                except Exception as fetch_err:
+                    issues[index] = fetch_err
+
+            async with anyio.create_task_group() as task_group:
+                for index, match in enumerate(jira_matches):
+                    task_group.start_soon(fetch, index, match.key)
+
+            for match, issue_dict in zip(jira_matches, issues, strict=True):
+                if isinstance(issue_dict, Exception):
+                    logger.warning(
+                        f"Failed to fetch Jira issue {match.key}: {issue_dict}"
                     )
-                except Exception as issue_err:
-                    logger.warning(f"Failed to fetch Jira issue {match.key}: {issue_err}")
                     result["linked_jira_issues"].append(
                         {
                             "key": match.key,
                             "source": match.source,
                             "confidence": match.confidence,
-                            "error": str(issue_err),
+                            "error": str(issue_dict),
                         }
                     )
+                    continue
+                result["linked_jira_issues"].append(
+                    {
+                        "key": match.key,
+                        "source": match.source,
+                        "confidence": match.confidence,
+                        "issue": issue_dict,
+                    }
+                )
 
         except ValueError as e:
             result["errors"].append(f"Jira not available: {str(e)}")
@@ -312,32 +647,55 @@ async def get_pr_with_jira_context(
         "error_count": len(result["errors"]),
     }
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return result
 
 
-@composite_mcp.tool(tags={"composite", "read"})
-async def resolve_development_links(
+@composite_mcp.tool(tags={"composite", "bitbucket", "jira", "read"})
+async def get_pr_with_jira_context(
     ctx: Context,
-    identifier: Annotated[
-        str,
-        Field(
-            description="Smart identifier - 'PROJ-123' for Jira issue, 'PROJECT/repo#456' for Bitbucket PR"
-        ),
-    ],
-    resolve_depth: Annotated[
-        int,
+    project_key: Annotated[str, Field(description="Bitbucket project key")],
+    repository_slug: Annotated[str, Field(description="Repository slug")],
+    pull_request_id: Annotated[int, Field(description="PR ID")],
+    resolve_jira_issues: Annotated[
+        bool,
         Field(
-            description="How deep to resolve links (1 = direct links only)",
-            default=1,
-            ge=1,
-            le=3,
+            description="Whether to resolve linked Jira issues",
+            default=True,
         ),
-    ] = 1,
+    ] = True,
 ) -> str:
-    """Resolve development links from any identifier.
+    """Get Bitbucket PR with linked Jira issue details.
 
-    Accepts either Jira issue keys or Bitbucket PR references and resolves
-    all linked development information.
+    This tool fetches a Bitbucket pull request and automatically extracts
+    and resolves any Jira issue keys found in the PR title, description,
+    or source branch name.
+
+    Args:
+        ctx: The FastMCP context.
+        project_key: Bitbucket project key
+        repository_slug: Repository slug
+        pull_request_id: PR ID
+        resolve_jira_issues: Whether to resolve linked Jira issues
+    Returns:
+        JSON with PR data and resolved Jira issues.
+    """
+    return _dumps(
+        await _build_pr_jira_context(
+            ctx,
+            project_key,
+            repository_slug,
+            pull_request_id,
+            resolve_jira_issues=resolve_jira_issues,
+        )
+    )
+
+
+async def _build_development_links(
+    ctx: Context,
+    identifier: str,
+    resolve_depth: int = 1,
+) -> dict[str, Any]:
+    """Build the resolved development context for a smart identifier.
 
     Args:
         ctx: The FastMCP context.
@@ -345,7 +703,7 @@ async def resolve_development_links(
         resolve_depth: How deep to resolve links (1 = direct links only)
 
     Returns:
-        JSON with resolved development context.
+        Dictionary with the resolved type, data, and any errors.
     """
     result: dict[str, Any] = {
         "identifier": identifier,
@@ -360,30 +718,33 @@ async def resolve_development_links(
         result["resolved_type"] = parsed.type
     except ValueError as e:
         result["errors"].append(str(e))
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return result
+
+    # Issues fetched while resolving this identifier, shared across the tree
+    issue_memo: dict[str, JiraIssue] = {}
 
     # Resolve based on type
     if parsed.type == "jira":
-        # Call get_issue_with_development_context
-        issue_result = await get_issue_with_development_context(
-            ctx=ctx,
-            issue_key=parsed.issue_key,
+        # Build the issue development context directly (no JSON round-trip)
+        result["data"] = await _build_issue_development_context(
+            ctx,
+            parsed.issue_key,
             include_pr_details=True,
             include_pr_diff_summary=False,
+            issue_memo=issue_memo,
         )
-        result["data"] = json.loads(issue_result)
 
     elif parsed.type == "bitbucket":
         if parsed.pr_id is not None:
-            # Call get_pr_with_jira_context
-            pr_result = await get_pr_with_jira_context(
-                ctx=ctx,
-                project_key=parsed.project_key,
-                repository_slug=parsed.repo_slug,
-                pull_request_id=parsed.pr_id,
+            # Build the PR Jira context directly (no JSON round-trip)
+            result["data"] = await _build_pr_jira_context(
+                ctx,
+                parsed.project_key,
+                parsed.repo_slug,
+                parsed.pr_id,
                 resolve_jira_issues=True,
+                issue_memo=issue_memo if resolve_depth > 1 else None,
             )
-            result["data"] = json.loads(pr_result)
 
             # If resolve_depth > 1, also resolve linked Jira issues' development info
             if resolve_depth > 1:
@@ -394,13 +755,15 @@ async def resolve_development_links(
                 for linked in linked_issues:
                     if "issue" in linked and "error" not in linked:
                         try:
-                            issue_dev_result = await get_issue_with_development_context(
-                                ctx=ctx,
-                                issue_key=linked["key"],
+                            linked[
+                                "development_context"
+                            ] = await _build_issue_development_context(
+                                ctx,
+                                linked["key"],
                                 include_pr_details=True,
                                 include_pr_diff_summary=False,
+                                issue_memo=issue_memo,
                             )
-                            linked["development_context"] = json.loads(issue_dev_result)
                         except Exception as e:
                             linked["development_context_error"] = str(e)
                     enhanced_issues.append(linked)
@@ -411,7 +774,8 @@ async def resolve_development_links(
             # Just a repo reference, list open PRs
             try:
                 bitbucket = await get_bitbucket_fetcher(ctx)
-                prs = bitbucket.get_pull_requests(
+                prs = await _run_blocking(
+                    bitbucket.get_pull_requests,
                     parsed.project_key,
                     parsed.repo_slug,
                     state="OPEN",
@@ -425,4 +789,41 @@ async def resolve_development_links(
             except Exception as e:
                 result["errors"].append(f"Failed to list PRs: {str(e)}")
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return result
+
+
+@composite_mcp.tool(tags={"composite", "read"})
+async def resolve_development_links(
+    ctx: Context,
+    identifier: Annotated[
+        str,
+        Field(
+            description="Smart identifier - 'PROJ-123' for Jira issue, 'PROJECT/repo#456' for Bitbucket PR"
+        ),
+    ],
+    resolve_depth: Annotated[
+        int,
+        Field(
+            description="How deep to resolve links (1 = direct links only)",
+            default=1,
+            ge=1,
+            le=3,
+        ),
+    ] = 1,
+) -> str:
+    """Resolve development links from any identifier.
+
+    Accepts either Jira issue keys or Bitbucket PR references and resolves
+    all linked development information.
+
+    Args:
+        ctx: The FastMCP context.
+        identifier: Smart identifier - "PROJ-123" for Jira, "PROJECT/repo#456" for PR
+        resolve_depth: How deep to resolve links (1 = direct links only)
+
+    Returns:
+        JSON with resolved development context.
+    """
+    return _dumps(
+        await _build_development_links(ctx, identifier, resolve_depth=resolve_depth)
+    )
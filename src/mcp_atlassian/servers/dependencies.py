@@ -27,6 +27,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+# Global BitbucketFetcher reused across tool calls so its connection pool
+# stays warm. Keyed by the config object it was built from.
+_global_bitbucket_fetcher: tuple[BitbucketConfig, BitbucketFetcher] | None = None
+
 
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
@@ -408,8 +412,13 @@ async def get_bitbucket_fetcher(ctx: Context) -> BitbucketFetcher:
             f"State.bitbucket_fetcher exists: {hasattr(request.state, 'bitbucket_fetcher') and request.state.bitbucket_fetcher is not None}."
         )
         # Use fetcher from request.state if already present
-        if hasattr(request.state, "bitbucket_fetcher") and request.state.bitbucket_fetcher:
-            logger.debug("get_bitbucket_fetcher: Returning BitbucketFetcher from request.state.")
+        if (
+            hasattr(request.state, "bitbucket_fetcher")
+            and request.state.bitbucket_fetcher
+        ):
+            logger.debug(
+                "get_bitbucket_fetcher: Returning BitbucketFetcher from request.state."
+            )
             return request.state.bitbucket_fetcher
 
         # Check if user provided PAT via headers
@@ -447,10 +456,12 @@ async def get_bitbucket_fetcher(ctx: Context) -> BitbucketFetcher:
                         logger.error(
                             f"get_bitbucket_fetcher: Failed to create user-specific BitbucketFetcher: {e}"
                         )
-                        raise ValueError(f"Invalid user Bitbucket token or configuration: {e}")
+                        raise ValueError(
+                            f"Invalid user Bitbucket token or configuration: {e}"
+                        )
         else:
             logger.debug(
-                f"get_bitbucket_fetcher: No user-specific token. Will use global fallback."
+                "get_bitbucket_fetcher: No user-specific token. Will use global fallback."
             )
     except RuntimeError:
         logger.debug(
@@ -465,11 +476,23 @@ async def get_bitbucket_fetcher(ctx: Context) -> BitbucketFetcher:
         else None
     )
     if app_lifespan_ctx_global and app_lifespan_ctx_global.full_bitbucket_config:
+        global _global_bitbucket_fetcher
+        global_config = app_lifespan_ctx_global.full_bitbucket_config
+        if (
+            _global_bitbucket_fetcher is not None
+            and _global_bitbucket_fetcher[0] is global_config
+        ):
+            logger.debug(
+                "get_bitbucket_fetcher: Reusing cached global BitbucketFetcher."
+            )
+            return _global_bitbucket_fetcher[1]
         logger.debug(
             "get_bitbucket_fetcher: Using global BitbucketFetcher from lifespan_context. "
-            f"Global config auth_type: {app_lifespan_ctx_global.full_bitbucket_config.auth_type}"
+            f"Global config auth_type: {global_config.auth_type}"
         )
-        return BitbucketFetcher(config=app_lifespan_ctx_global.full_bitbucket_config)
+        global_fetcher = BitbucketFetcher(config=global_config)
+        _global_bitbucket_fetcher = (global_config, global_fetcher)
+        return global_fetcher
     logger.error("Bitbucket configuration could not be resolved.")
     raise ValueError(
         "Bitbucket client (fetcher) not available. Ensure server is configured correctly."
@@ -1,11 +1,12 @@
 """Tool discovery module for intelligent tool recommendations."""
 
-from .index import ToolDiscoveryIndex
+from .index import ToolDiscoveryIndex, get_discovery_index
 from .scoring import score_tool_relevance
 from .types import ToolIndexEntry, ToolRecommendation
 
 __all__ = [
     "ToolDiscoveryIndex",
+    "get_discovery_index",
     "score_tool_relevance",
     "ToolIndexEntry",
     "ToolRecommendation",
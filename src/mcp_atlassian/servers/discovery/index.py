@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 import re
-from typing import TYPE_CHECKING
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import anyio
+from cachetools import LRUCache
 
 from .metadata import TOOL_ENHANCEMENTS
-from .scoring import score_tool_relevance
+from .scoring import (
+    QueryContext,
+    RelevanceMatch,
+    ToolScoringProfile,
+    _extract_words,
+    build_tool_profile,
+    match_tool_relevance,
+    prepare_query,
+    relevance_upper_bound,
+)
 from .types import ToolIndexEntry, ToolRecommendation
 
 if TYPE_CHECKING:
@@ -15,18 +33,250 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("mcp-atlassian.discovery")
 
+# Keyword tokens: runs of 3+ ASCII letters (shorter words are never keywords),
+# matched on the lowercased ASCII bytes of a description
+_WORD_RE = re.compile(rb"[a-z]{3,}")
+
+# Number of distinct search calls whose results are memoized, keyed by
+# (stripped query, service_filter, include_write, limit)
+_SEARCH_CACHE_SIZE = 256
+_SearchKey = tuple[str, str | None, bool, int]
+
+# Service tags in priority order; tools without any of them are composite
+_SERVICE_TAGS = ("jira", "confluence", "bitbucket", "meta")
+_SERVICE_TAG_SET = frozenset(_SERVICE_TAGS)
+
+# Common words filtered out of tool descriptions when extracting keywords
+_STOP_WORDS: frozenset[str] = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "can",
+        "to",
+        "of",
+        "in",
+        "for",
+        "on",
+        "with",
+        "at",
+        "by",
+        "from",
+        "as",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "between",
+        "under",
+        "again",
+        "further",
+        "then",
+        "once",
+        "here",
+        "there",
+        "when",
+        "where",
+        "why",
+        "how",
+        "all",
+        "each",
+        "few",
+        "more",
+        "most",
+        "other",
+        "some",
+        "such",
+        "no",
+        "nor",
+        "not",
+        "only",
+        "own",
+        "same",
+        "so",
+        "than",
+        "too",
+        "very",
+        "just",
+        "and",
+        "or",
+        "but",
+        "if",
+        "because",
+        "while",
+        "although",
+        "this",
+        "that",
+        "these",
+        "those",
+        "it",
+        "its",
+        "they",
+        "them",
+        "their",
+        "which",
+        "who",
+        "whom",
+        "whose",
+        "what",
+        "e",
+        "g",
+        "eg",
+        "ie",
+        "etc",
+        "args",
+        "ctx",
+        "returns",
+        "raises",
+        "optional",
+        "default",
+        "none",
+        "true",
+        "false",
+        "string",
+        "json",
+        "object",
+        "list",
+        "dict",
+        "int",
+        "float",
+        "bool",
+        "representing",
+        "specified",
+        "specific",
+        "fastmcp",
+        "context",
+    }
+)
+
+
+_STOP_WORDS_BYTES = frozenset(word.encode("ascii") for word in _STOP_WORDS)
+
+# C-level sort keys for (score, position, name, tool, match) results
+_result_score = itemgetter(0)
+_result_position = itemgetter(1)
+
+# Tools never recommended by search; discover_tools would only point back
+# at itself
+_EXCLUDED_FROM_SEARCH: frozenset[str] = frozenset({"discover_tools"})
+
+# Minimum relevance score for a tool to be recommended
+_MIN_RELEVANCE = 0.1
+# Slack added to score bounds so float rounding can never prune a real match
+_BOUND_EPSILON = 1e-9
+
+_IndexedTools = list[tuple[str, tuple[ToolIndexEntry, ToolScoringProfile]]]
+
+# Tools must share this many character trigrams with a query whose words
+# match no indexed term to be scored for it
+_MIN_SHARED_TRIGRAMS = 2
+
+# Query tokens shorter than this are not expanded through the prefix trie
+_MIN_PREFIX_LENGTH = 3
+# Maximum number of indexed terms a single query token may expand to
+_MAX_PREFIX_EXPANSIONS = 16
+
+
+def _trigrams(term: str) -> set[str]:
+    """Return the character trigrams of a term."""
+    return {term[i : i + 3] for i in range(len(term) - 2)}
+
+
+class _PrefixTrie:
+    """Character trie mapping indexed terms to the names of tools using them."""
+
+    __slots__ = ("_root",)
+
+    _TERMINAL = ""  # Children are single characters, so "" never collides
+
+    def __init__(self) -> None:
+        self._root: dict[str, Any] = {}
+
+    def add(self, term: str, names: set[str]) -> None:
+        """Register ``names`` as the tools containing ``term``."""
+        node = self._root
+        for char in term:
+            node = node.setdefault(char, {})
+        node[self._TERMINAL] = names
+
+    def names_with_prefix(self, prefix: str, max_terms: int) -> set[str]:
+        """Return tools owning the first ``max_terms`` terms under ``prefix``."""
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return set()
+
+        names: set[str] = set()
+        stack = [node]
+        terms_seen = 0
+        while stack and terms_seen < max_terms:
+            node = stack.pop()
+            for char, child in node.items():
+                if char == self._TERMINAL:
+                    names |= child
+                    terms_seen += 1
+                else:
+                    stack.append(child)
+        return names
+
 
 class ToolDiscoveryIndex:
-    """Singleton index of all available tools."""
+    """Singleton index of all available tools.
+
+    Production code gets the instance from ``get_discovery_index``.
+    """
 
     _instance: ToolDiscoveryIndex | None = None
     _tools: dict[str, ToolIndexEntry]
+    _profiles: dict[str, tuple[ToolIndexEntry, ToolScoringProfile]]
+    _postings: dict[str, set[str]]
+    _postings_source: dict[str, ToolIndexEntry] | None
+    _service_tools: dict[str, set[str]]
+    _write_tools: set[str]
+    _prefix_trie: _PrefixTrie
+    _trigram_postings: dict[str, set[str]]
+    _search_cache: LRUCache[_SearchKey, list[ToolRecommendation]]
+    _build_lock: anyio.Lock
     _built: bool
 
     def __new__(cls) -> ToolDiscoveryIndex:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._tools = {}
+            cls._instance._profiles = {}
+            cls._instance._postings = {}
+            cls._instance._postings_source = None
+            cls._instance._service_tools = {}
+            cls._instance._write_tools = set()
+            cls._instance._prefix_trie = _PrefixTrie()
+            cls._instance._trigram_postings = {}
+            cls._instance._search_cache = LRUCache(maxsize=_SEARCH_CACHE_SIZE)
+            cls._instance._build_lock = anyio.Lock()
             cls._instance._built = False
         return cls._instance
 
@@ -42,205 +292,208 @@ class ToolDiscoveryIndex:
 
     def _extract_keywords_from_description(self, description: str) -> set[str]:
         """Extract meaningful keywords from a tool description."""
-        # Common words to filter out
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "shall",
-            "can",
-            "to",
-            "of",
-            "in",
-            "for",
-            "on",
-            "with",
-            "at",
-            "by",
-            "from",
-            "as",
-            "into",
-            "through",
-            "during",
-            "before",
-            "after",
-            "above",
-            "below",
-            "between",
-            "under",
-            "again",
-            "further",
-            "then",
-            "once",
-            "here",
-            "there",
-            "when",
-            "where",
-            "why",
-            "how",
-            "all",
-            "each",
-            "few",
-            "more",
-            "most",
-            "other",
-            "some",
-            "such",
-            "no",
-            "nor",
-            "not",
-            "only",
-            "own",
-            "same",
-            "so",
-            "than",
-            "too",
-            "very",
-            "just",
-            "and",
-            "or",
-            "but",
-            "if",
-            "because",
-            "while",
-            "although",
-            "this",
-            "that",
-            "these",
-            "those",
-            "it",
-            "its",
-            "they",
-            "them",
-            "their",
-            "which",
-            "who",
-            "whom",
-            "whose",
-            "what",
-            "e",
-            "g",
-            "eg",
-            "ie",
-            "etc",
-            "args",
-            "ctx",
-            "returns",
-            "raises",
-            "optional",
-            "default",
-            "none",
-            "true",
-            "false",
-            "string",
-            "json",
-            "object",
-            "list",
-            "dict",
-            "int",
-            "float",
-            "bool",
-            "representing",
-            "specified",
-            "specific",
-            "fastmcp",
-            "context",
-        }
-
-        # Extract words
-        words = re.findall(r"[a-zA-Z]+", description.lower())
-
-        # Filter and return meaningful keywords
-        return {w for w in words if len(w) > 2 and w not in stop_words}
-
-    def _determine_service(self, tags: set[str]) -> str:
+        # Scan ASCII bytes: non-ASCII characters become "?" and so still end
+        # words, and bytes.lower() skips Unicode case mapping
+        text = description.encode("ascii", "replace").lower()
+
+        # Drop stop words before decoding, then decode each distinct token
+        # once; interning makes a keyword shared by many tools one object
+        tokens = set(_WORD_RE.findall(text))
+        tokens -= _STOP_WORDS_BYTES
+        return {sys.intern(token.decode("ascii")) for token in tokens}
+
+    def _determine_service(self, tags: frozenset[str] | set[str]) -> str:
         """Determine the service from tool tags."""
-        if "jira" in tags:
-            return "jira"
-        elif "confluence" in tags:
-            return "confluence"
-        elif "bitbucket" in tags:
-            return "bitbucket"
-        elif "meta" in tags:
-            return "meta"
-        else:
+        if tags.isdisjoint(_SERVICE_TAG_SET):
             return "composite"
+        return next(service for service in _SERVICE_TAGS if service in tags)
+
+    def _get_profile(self, name: str, tool: ToolIndexEntry) -> ToolScoringProfile:
+        """Return the precomputed scoring profile for a tool, building it if stale."""
+        cached = self._profiles.get(name)
+        if cached is not None and cached[0] is tool:
+            return cached[1]
+        profile = build_tool_profile(tool)
+        self._profiles[name] = (tool, profile)
+        return profile
+
+    def _ensure_postings(self) -> dict[str, set[str]]:
+        """Build the term -> tool names inverted index for the current tools.
+
+        Terms are the tool's words, canonical actions and entities, parameter
+        words and tags. A prefix trie and a character trigram index over the
+        same terms, a service -> tool names map and the set of write tools
+        are built alongside. All are rebuilt whenever the tool map is
+        replaced.
+        """
+        if self._postings_source is self._tools:
+            return self._postings
+
+        postings: dict[str, set[str]] = {}
+        service_tools: dict[str, set[str]] = {}
+        write_tools: set[str] = set()
+        for name, tool in self._tools.items():
+            service_tools.setdefault(tool.service, set()).add(name)
+            if tool.is_write:
+                write_tools.add(name)
+            profile = self._get_profile(name, tool)
+            terms = set(profile.all_words | profile.actions | profile.entities)
+            for parameter in tool.parameters:
+                terms |= _extract_words(parameter)
+            terms |= tool.tags
+            for term in terms:
+                postings.setdefault(term, set()).add(name)
+
+        prefix_trie = _PrefixTrie()
+        trigram_postings: dict[str, set[str]] = {}
+        for term, names in postings.items():
+            prefix_trie.add(term, names)
+            for trigram in _trigrams(term):
+                trigram_postings.setdefault(trigram, set()).update(names)
+
+        self._postings = postings
+        self._service_tools = service_tools
+        self._write_tools = write_tools
+        self._prefix_trie = prefix_trie
+        self._trigram_postings = trigram_postings
+        self._postings_source = self._tools
+        # Cached results were computed against the previous tool map
+        self._search_cache.clear()
+        return postings
+
+    def _get_candidates(self, query: str | QueryContext) -> set[str] | None:
+        """Return tools sharing at least one term with the query.
+
+        Besides exact postings, each query token expands to indexed terms it
+        is a prefix of (e.g. "issu" -> "issue"), so truncated words still
+        select the right tools. When no token matches that way, e.g. for
+        misspelled words, tools sharing enough character trigrams with the
+        query are used instead.
+
+        Search scores these tools first; they are an ordering hint, not a
+        filter, as tools sharing no term can still match fuzzily.
+
+        Returns:
+            Candidate tool names, or None when the query has no indexed terms.
+        """
+        if isinstance(query, str):
+            query = prepare_query(query)
+        query_terms = set(query.words | query.actions | query.entities)
+
+        postings = self._ensure_postings()
+        candidates: set[str] = set()
+        for term in query_terms:
+            candidates |= postings.get(term, set())
+            if len(term) >= _MIN_PREFIX_LENGTH:
+                candidates |= self._prefix_trie.names_with_prefix(
+                    term, _MAX_PREFIX_EXPANSIONS
+                )
+        if not candidates:
+            candidates = self._get_trigram_candidates(query_terms)
+        return candidates or None
+
+    def _get_trigram_candidates(self, query_terms: set[str]) -> set[str]:
+        """Return tools sharing enough character trigrams with the query."""
+        query_trigrams = set()
+        for term in query_terms:
+            query_trigrams |= _trigrams(term)
+
+        shared: Counter[str] = Counter()
+        for trigram in query_trigrams:
+            shared.update(self._trigram_postings.get(trigram, ()))
+        return {name for name, count in shared.items() if count >= _MIN_SHARED_TRIGRAMS}
+
+    def _build_entry(self, registered_name: str, tool_obj: Any) -> ToolIndexEntry:
+        """Build the index entry for one registered tool."""
+        # Tags and keywords are lowercased here, once, so the service checks,
+        # postings and scoring can compare them to lowercase query words as-is
+        tags = frozenset(sys.intern(tag.lower()) for tag in tool_obj.tags or ())
+        description = tool_obj.description or ""
+
+        # Determine service and write status
+        service = self._determine_service(tags)
+        is_write = "write" in tags
+
+        # Extract parameter names
+        parameters: tuple[str, ...] = ()
+        if tool_obj.parameters:
+            # FastMCP tool parameters are in JSON schema format
+            schema = tool_obj.parameters
+            if isinstance(schema, dict) and "properties" in schema:
+                parameters = tuple(map(sys.intern, schema["properties"]))
+
+        # Extract keywords from description
+        keywords = self._extract_keywords_from_description(description)
+
+        # Get enhancement metadata if available; most tools have none, and
+        # those share the empty tuples instead of converting empty defaults
+        use_cases: tuple[str, ...] = ()
+        examples: tuple[str, ...] = ()
+        enhancement = TOOL_ENHANCEMENTS.get(registered_name)
+        if enhancement is not None:
+            use_cases = tuple(enhancement.get("use_cases", ()))
+            examples = tuple(enhancement.get("examples", ()))
+            keywords.update(
+                sys.intern(keyword.lower())
+                for keyword in enhancement.get("keywords", ())
+            )
+
+        return ToolIndexEntry(
+            name=registered_name,
+            description=description,
+            service=service,
+            is_write=is_write,
+            tags=tags,
+            parameters=parameters,
+            use_cases=use_cases,
+            examples=examples,
+            keywords=frozenset(keywords),
+        )
+
+    def _index_tools(self, all_tools: Mapping[str, Any]) -> _IndexedTools:
+        """Build entries and scoring profiles for all tools.
+
+        Only reads shared state, so it is safe to run in a worker thread.
+        """
+        indexed: _IndexedTools = []
+        for registered_name, tool_obj in all_tools.items():
+            entry = self._build_entry(registered_name, tool_obj)
+            # Precompute the query-independent scoring data once per tool
+            indexed.append((registered_name, (entry, build_tool_profile(entry))))
+        return indexed
 
     async def build_index(self, mcp_server: FastMCP) -> None:
         """Build index from MCP server's registered tools.
 
+        Concurrent callers are serialized, so only the first one builds and
+        the rest return once it has finished.
+
         Args:
             mcp_server: The FastMCP server instance to index tools from.
         """
-        if self._built:
-            logger.debug("Index already built, skipping rebuild")
-            return
+        async with self._build_lock:
+            if self._built:
+                logger.debug("Index already built, skipping rebuild")
+                return
+
+            await self._build_index_locked(mcp_server)
 
+    async def _build_index_locked(self, mcp_server: FastMCP) -> None:
+        """Build the index; the caller holds ``_build_lock``."""
         logger.info("Building tool discovery index...")
 
         # Get all tools from the server (includes mounted sub-servers)
         all_tools = await mcp_server.get_tools()
 
-        for registered_name, tool_obj in all_tools.items():
-            tags = tool_obj.tags or set()
-            description = tool_obj.description or ""
-
-            # Determine service and write status
-            service = self._determine_service(tags)
-            is_write = "write" in tags
-
-            # Extract parameter names
-            parameters = []
-            if tool_obj.parameters:
-                # FastMCP tool parameters are in JSON schema format
-                schema = tool_obj.parameters
-                if isinstance(schema, dict) and "properties" in schema:
-                    parameters = list(schema["properties"].keys())
-
-            # Get enhancement metadata if available
-            enhancement = TOOL_ENHANCEMENTS.get(registered_name, {})
-            use_cases = list(enhancement.get("use_cases", []))
-            examples = list(enhancement.get("examples", []))
-            extra_keywords = set(enhancement.get("keywords", set()))
-
-            # Extract keywords from description
-            keywords = self._extract_keywords_from_description(description)
-            keywords |= extra_keywords
-
-            # Create the index entry
-            entry = ToolIndexEntry(
-                name=registered_name,
-                description=description,
-                service=service,
-                is_write=is_write,
-                tags=tags,
-                parameters=parameters,
-                use_cases=use_cases,
-                examples=examples,
-                keywords=keywords,
-            )
+        # Extraction is pure Python, so tool-level threads would just contend
+        # for the GIL; run the whole pass in one worker thread instead so
+        # the event loop stays responsive while a large tool set is indexed
+        indexed = await anyio.to_thread.run_sync(self._index_tools, all_tools)
 
-            self._tools[registered_name] = entry
+        self._profiles = dict(indexed)
+        # Replacing the tool map invalidates the postings built for the old one
+        self._tools = {name: entry for name, (entry, _) in indexed}
+        self._ensure_postings()
 
         self._built = True
         logger.info(f"Tool discovery index built with {len(self._tools)} tools")
@@ -267,40 +520,98 @@ class ToolDiscoveryIndex:
             logger.warning("Index not built, returning empty results")
             return []
 
-        results: list[tuple[float, ToolRecommendation]] = []
+        # Scoring strips the query itself, so stripped queries share results
+        self._ensure_postings()
+        cache_key = (query.strip(), service_filter, include_write, limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
 
-        for name, tool in self._tools.items():
-            # Apply filters
-            if service_filter and tool.service != service_filter.lower():
-                continue
+        recommendations = self._search_uncached(
+            query, service_filter, include_write, limit
+        )
+        self._search_cache[cache_key] = recommendations
+        return list(recommendations)
 
-            if not include_write and tool.is_write:
-                continue
-
-            # Skip the discover_tools itself to avoid recursion
-            if name == "discover_tools":
+    def _search_uncached(
+        self,
+        query: str,
+        service_filter: str | None,
+        include_write: bool,
+        limit: int,
+    ) -> list[ToolRecommendation]:
+        """Score and rank tools for a query without consulting the cache."""
+        results: list[tuple[float, int, str, ToolIndexEntry, RelevanceMatch]] = []
+        # Min-heap of the best `limit` scores so far; its root is the score
+        # a new tool must beat to reach the top results
+        top_scores: list[float] = []
+        # Normalize the query once instead of once per scored tool
+        prepared = prepare_query(query)
+
+        # Apply the service and write filters up front instead of checking
+        # every tool in the loop; the index's sets are shared, so they are
+        # combined without mutating them
+        eligible = self._tools.keys() - _EXCLUDED_FROM_SEARCH
+        if service_filter:
+            eligible &= self._service_tools.get(service_filter.lower(), set())
+        if not include_write and self._write_tools:
+            eligible -= self._write_tools
+
+        # Score tools sharing a term with the query first, so the top-k
+        # threshold rises early; the rest are still visited, since fuzzy, use
+        # case and example matches can rank a tool with no shared term, but
+        # most of them are then pruned by their score bound
+        candidates = self._get_candidates(prepared) or set()
+        tools = [
+            (position, name, tool)
+            for position, (name, tool) in enumerate(self._tools.items())
+            if name in eligible
+        ]
+        tools.sort(key=lambda item: item[1] not in candidates)
+
+        for position, name, tool in tools:
+            # Skip full scoring when even the tool's best possible score
+            # cannot pass the relevance floor or displace the current top-k
+            profile = self._get_profile(name, tool)
+            threshold = _MIN_RELEVANCE
+            if limit > 0 and len(top_scores) == limit:
+                threshold = max(threshold, top_scores[0])
+            bound = relevance_upper_bound(prepared, profile) + _BOUND_EPSILON
+            if bound < threshold:
                 continue
 
-            # Score the tool
-            score, reasons = score_tool_relevance(query, tool)
+            # Score the tool, reusing its precomputed profile; reasons are only
+            # formatted below for the tools that make the cut
+            match = match_tool_relevance(prepared, tool, profile=profile)
+            score = match.score
 
             # Only include tools with some relevance
-            if score > 0.1:
-                recommendation = ToolRecommendation(
-                    name=name,
-                    description=tool.description,
-                    relevance_score=score,
-                    match_reasons=reasons,
-                    service=tool.service,
-                    is_write=tool.is_write,
-                )
-                results.append((score, recommendation))
-
-        # Sort by score descending
-        results.sort(key=lambda x: x[0], reverse=True)
-
-        # Return top N recommendations
-        return [rec for _, rec in results[:limit]]
+            if score > _MIN_RELEVANCE:
+                if limit > 0:
+                    if len(top_scores) < limit:
+                        heapq.heappush(top_scores, score)
+                    else:
+                        heapq.heappushpop(top_scores, score)
+                results.append((score, position, name, tool, match))
+
+        # Restore index order so that ties rank as in a plain full scan
+        results.sort(key=_result_position)
+
+        # Return top N recommendations by score; nlargest is stable like the
+        # full reverse sort it replaces, so ties keep index order
+        return [
+            ToolRecommendation(
+                name=name,
+                description=tool.description,
+                relevance_score=score,
+                match_reasons=match.reasons(),
+                service=tool.service,
+                is_write=tool.is_write,
+            )
+            for score, _, name, tool, match in heapq.nlargest(
+                limit, results, key=_result_score
+            )
+        ]
 
     def get_tool(self, name: str) -> ToolIndexEntry | None:
         """Get a specific tool by name.
@@ -313,10 +624,22 @@ class ToolDiscoveryIndex:
         """
         return self._tools.get(name)
 
-    def get_all_tools(self) -> dict[str, ToolIndexEntry]:
+    def get_all_tools(self) -> Mapping[str, ToolIndexEntry]:
         """Get all indexed tools.
 
         Returns:
-            Dictionary of all indexed tools
+            Read-only view of all indexed tools; use ``dict(...)`` for a copy
         """
-        return self._tools.copy()
+        return MappingProxyType(self._tools)
+
+
+def get_discovery_index() -> ToolDiscoveryIndex:
+    """Get the process-wide tool discovery index.
+
+    Returns:
+        The ToolDiscoveryIndex singleton, created on first use.
+    """
+    instance = ToolDiscoveryIndex._instance
+    if instance is None:
+        instance = ToolDiscoveryIndex()
+    return instance
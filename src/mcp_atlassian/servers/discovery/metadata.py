@@ -4,7 +4,10 @@ Additional use cases and examples for tools.
 These enhance the base tool descriptions for better discovery.
 """
 
-TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
+from collections.abc import Mapping
+from types import MappingProxyType
+
+_ENHANCEMENT_LITERALS: dict[str, dict[str, list[str] | set[str]]] = {
     # =========================================================================
     # Jira Tools
     # =========================================================================
@@ -714,3 +717,23 @@ TOOL_ENHANCEMENTS: dict[str, dict[str, list[str] | set[str]]] = {
         "keywords": {"create", "repository", "repo", "new"},
     },
 }
+
+
+# Frozen once at import: lists become tuples and keyword sets frozensets, so
+# index entries can share them instead of copying, and nothing can mutate
+# the metadata at runtime
+TOOL_ENHANCEMENTS: Mapping[str, Mapping[str, tuple[str, ...] | frozenset[str]]] = (
+    MappingProxyType(
+        {
+            name: MappingProxyType(
+                {
+                    field: frozenset(values)
+                    if isinstance(values, set)
+                    else tuple(values)
+                    for field, values in enhancement.items()
+                }
+            )
+            for name, enhancement in _ENHANCEMENT_LITERALS.items()
+        }
+    )
+)
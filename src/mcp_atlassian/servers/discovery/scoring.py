@@ -1,11 +1,21 @@
-"""Relevance scoring for tool discovery."""
+"""Relevance scoring for tool discovery.
+
+Scoring is string and set work on Python ``str``/``set``/``dict`` objects,
+so speedups come from precomputing tool data once (``build_tool_profile``),
+narrowing candidates through the index's postings and memoizing; JIT or
+Cython compilation cannot accelerate these object types and would add
+startup cost far beyond a microsecond-scale scoring call.
+"""
 
 from __future__ import annotations
 
+import heapq
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from thefuzz import fuzz
+from rapidfuzz import fuzz
 
 if TYPE_CHECKING:
     from .types import ToolIndexEntry
@@ -44,157 +54,334 @@ ENTITY_SYNONYMS: dict[str, list[str]] = {
     "project": ["workspace", "space", "team"],
 }
 
-# Build reverse lookup for efficiency
-# First pass: set all canonical keys to themselves (priority)
-_ACTION_REVERSE: dict[str, str] = {}
-for canonical in ACTION_SYNONYMS.keys():
-    _ACTION_REVERSE[canonical] = canonical
 
-# Second pass: add synonyms only if not already a canonical key
-for canonical, synonyms in ACTION_SYNONYMS.items():
-    for syn in synonyms:
-        if syn not in _ACTION_REVERSE:
-            _ACTION_REVERSE[syn] = canonical
+def _build_reverse_map(synonyms: dict[str, list[str]]) -> dict[str, str]:
+    """Map each canonical word and synonym to its canonical word.
+
+    Canonical words map to themselves even when listed as another word's
+    synonym; otherwise a synonym maps to the first canonical listing it.
+    """
+    # Reversed iteration lets the earliest listing overwrite later ones
+    reverse = {
+        syn: canonical for canonical, syns in reversed(synonyms.items()) for syn in syns
+    }
+    reverse.update((canonical, canonical) for canonical in synonyms)
+    return reverse
+
+
+# Reverse lookups for efficiency; kept as plain dicts (not MappingProxyType)
+# because they are read on every scoring call and a proxy doubles .get cost
+_ACTION_REVERSE: dict[str, str] = _build_reverse_map(ACTION_SYNONYMS)
+_ENTITY_REVERSE: dict[str, str] = _build_reverse_map(ENTITY_SYNONYMS)
+
+
+# Weight of each scoring factor when no custom weights are given
+_DEFAULT_WEIGHTS: dict[str, float] = {
+    "keyword": 0.25,
+    "action": 0.20,
+    "entity": 0.25,
+    "fuzzy": 0.20,
+    "use_case": 0.10,
+}
 
-# Same for entities
-_ENTITY_REVERSE: dict[str, str] = {}
-for canonical in ENTITY_SYNONYMS.keys():
-    _ENTITY_REVERSE[canonical] = canonical
 
-for canonical, synonyms in ENTITY_SYNONYMS.items():
-    for syn in synonyms:
-        if syn not in _ENTITY_REVERSE:
-            _ENTITY_REVERSE[syn] = canonical
+# Runs of ASCII letters, split where a lowercase letter is followed by an
+# uppercase one (camelCase boundaries): "getHTTPServer" -> "get", "HTTPServer"
+_WORD_RE = re.compile(r"[A-Z]*[a-z]+|[A-Z]+")
 
 
 def _normalize_text(text: str) -> str:
-    """Normalize text for comparison - lowercase and strip."""
+    """Normalize text for comparison - lowercase and strip.
+
+    Uses lower() rather than casefold() so a query compares like the tool
+    texts lowercased in build_tool_profile.
+    """
     return text.lower().strip()
 
 
-def _extract_words(text: str) -> set[str]:
+@lru_cache(maxsize=4096)
+def _extract_words(text: str) -> frozenset[str]:
     """Extract words from text, handling underscores and camelCase."""
-    # Replace underscores with spaces
-    text = text.replace("_", " ")
-    # Insert spaces before capitals for camelCase
-    text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
-    # Split on whitespace and punctuation
-    words = re.findall(r"[a-zA-Z]+", text.lower())
-    return set(words)
+    # One scan splits on anything but letters, which covers whitespace,
+    # punctuation and underscores, and on camelCase boundaries; memoized
+    # because the same tool names and repeated queries are tokenized often
+    return frozenset(map(str.lower, _WORD_RE.findall(text)))
+
+
+@dataclass(slots=True, frozen=True)
+class QueryContext:
+    """Tool-independent preprocessing of a query, computed once per search."""
+
+    normalized: str
+    words: frozenset[str]
+    actions: frozenset[str]
+    entities: frozenset[str]
+    # Number of keyword hits that earns the full keyword score
+    keyword_denominator: float
+
+
+def prepare_query(query: str) -> QueryContext:
+    """Normalize a query and resolve its canonical actions and entities.
+
+    Args:
+        query: Natural language task description
+
+    Returns:
+        QueryContext to pass when scoring many tools against the same query
+    """
+    words = _extract_words(query)
+    return QueryContext(
+        normalized=_normalize_text(query),
+        words=words,
+        actions=frozenset(
+            a for w in words if (a := _ACTION_REVERSE.get(w)) is not None
+        ),
+        entities=frozenset(
+            e for w in words if (e := _ENTITY_REVERSE.get(w)) is not None
+        ),
+        keyword_denominator=max(1, len(words) / 2),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class ToolScoringProfile:
+    """Query-independent scoring data for a tool, computed once per tool.
+
+    Holds everything ``score_tool_relevance`` reads from the tool, so scoring
+    a query against a profiled tool does no tool-side work.
+    """
+
+    keywords: frozenset[str]
+    all_words: frozenset[str]
+    actions: frozenset[str]
+    entities: frozenset[str]
+    description_lower: str
+    name_spaced: str
+    use_cases_lower: tuple[tuple[str, str], ...]
+    examples_lower: tuple[tuple[str, str], ...]
+
+
+def build_tool_profile(tool: ToolIndexEntry) -> ToolScoringProfile:
+    """Precompute the parts of ``score_tool_relevance`` that only depend on the tool.
+
+    Args:
+        tool: Tool to profile
+
+    Returns:
+        ToolScoringProfile for the tool
+    """
+    name_words = _extract_words(tool.name)
+    desc_words = _extract_words(tool.description)
+    text_words = name_words | desc_words
+    actions = {a for w in name_words if (a := _ACTION_REVERSE.get(w)) is not None}
+    entities = {e for w in text_words if (e := _ENTITY_REVERSE.get(w)) is not None}
+    # Also include service as an entity
+    entities.add(tool.service)
+    return ToolScoringProfile(
+        keywords=frozenset(tool.keywords),
+        all_words=frozenset(text_words | tool.keywords),
+        actions=frozenset(actions),
+        entities=frozenset(entities),
+        description_lower=tool.description.lower(),
+        name_spaced=tool.name.lower().replace("_", " "),
+        use_cases_lower=tuple((uc, uc.lower()) for uc in tool.use_cases),
+        examples_lower=tuple((ex, ex.lower()) for ex in tool.examples),
+    )
+
+
+def relevance_upper_bound(
+    query: QueryContext,
+    profile: ToolScoringProfile,
+    weights: dict[str, float] | None = None,
+) -> float:
+    """Bound the score ``score_tool_relevance`` can give a profiled tool.
 
+    The word-set factors are computed exactly; the fuzzy description, name,
+    use case and example factors are assumed to score their maximum. This
+    avoids the fuzzy matching, which dominates the cost of scoring.
 
-def _get_canonical_action(word: str) -> str | None:
-    """Get the canonical action verb for a word, if it's an action."""
-    return _ACTION_REVERSE.get(word.lower())
+    Args:
+        query: Prepared query
+        profile: Precomputed profile of the tool
+        weights: Optional custom weights for scoring factors
 
+    Returns:
+        Upper bound of the tool's relevance score
+    """
+    weights = weights or _DEFAULT_WEIGHTS
+    bound = weights["fuzzy"] + 0.05  # Description and name fuzzy matches
+
+    query_words = query.words
+    hits = query_words & profile.all_words
+    if hits:
+        bound += weights["keyword"] * min(1.0, len(hits) / query.keyword_denominator)
+    explicit_keyword_hits = len(hits & profile.keywords)
+    if explicit_keyword_hits:
+        bound += 0.1 * min(1.0, explicit_keyword_hits / 2)
 
-def _get_canonical_entity(word: str) -> str | None:
-    """Get the canonical entity for a word, if it's an entity."""
-    return _ENTITY_REVERSE.get(word.lower())
+    if not profile.actions.isdisjoint(query.actions):
+        bound += weights["action"]
+    if not profile.entities.isdisjoint(query.entities):
+        bound += weights["entity"]
+
+    if profile.use_cases_lower:
+        bound += weights["use_case"]
+    if profile.examples_lower:
+        bound += 0.05
+    return min(1.0, bound)
+
+
+@dataclass(slots=True)
+class RelevanceMatch:
+    """Score of a tool for a query, plus what matched.
+
+    Match reasons are only formatted on request, so callers ranking many
+    tools can build them for the top results alone.
+    """
+
+    score: float
+    keyword_hits: frozenset[str]
+    action_matches: frozenset[str]
+    entity_matches: frozenset[str]
+    description_ratio: int = 0
+    best_use_case: str = ""
+    best_use_case_score: float = 0.0
+    matched_example: str | None = None
+
+    def reasons(self) -> list[str]:
+        """Format the human-readable match reasons."""
+        reasons: list[str] = []
+        if self.keyword_hits:
+            hits = ", ".join(heapq.nsmallest(3, self.keyword_hits))
+            reasons.append(f"keyword match: {hits}")
+        if self.action_matches:
+            reasons.append(f"action match: {', '.join(sorted(self.action_matches))}")
+        if self.entity_matches:
+            reasons.append(f"entity match: {', '.join(sorted(self.entity_matches))}")
+        if self.description_ratio > 75:
+            reasons.append(f"description similarity: {self.description_ratio}%")
+        if self.best_use_case_score > 80:
+            reasons.append(f"use case: '{self.best_use_case}'")
+        if self.matched_example is not None:
+            reasons.append(f"similar to example: '{self.matched_example[:40]}...'")
+        return reasons
 
 
 def score_tool_relevance(
-    query: str,
+    query: str | QueryContext,
     tool: ToolIndexEntry,
     weights: dict[str, float] | None = None,
+    profile: ToolScoringProfile | None = None,
 ) -> tuple[float, list[str]]:
     """Score how relevant a tool is to a query.
 
     Args:
-        query: Natural language task description
+        query: Natural language task description, or one already prepared
+            with ``prepare_query``
         tool: Tool to score
         weights: Optional custom weights for scoring factors
+        profile: Optional precomputed profile of the tool (built if omitted)
 
     Returns:
         Tuple of (score 0.0-1.0, list of match reasons)
     """
-    default_weights = {
-        "keyword": 0.25,
-        "action": 0.20,
-        "entity": 0.25,
-        "fuzzy": 0.20,
-        "use_case": 0.10,
-    }
-    weights = weights or default_weights
+    match = match_tool_relevance(query, tool, weights, profile)
+    return match.score, match.reasons()
 
-    score = 0.0
-    reasons: list[str] = []
 
-    query_normalized = _normalize_text(query)
-    query_words = _extract_words(query)
+def match_tool_relevance(
+    query: str | QueryContext,
+    tool: ToolIndexEntry,
+    weights: dict[str, float] | None = None,
+    profile: ToolScoringProfile | None = None,
+) -> RelevanceMatch:
+    """Score how relevant a tool is to a query, deferring reason formatting.
 
-    # Extract words from tool name and description
-    tool_name_words = _extract_words(tool.name)
-    tool_desc_words = _extract_words(tool.description)
-    all_tool_words = tool_name_words | tool_desc_words | tool.keywords
+    Args:
+        query: Natural language task description, or one already prepared
+            with ``prepare_query``
+        tool: Tool to score
+        weights: Optional custom weights for scoring factors
+        profile: Optional precomputed profile of the tool (built if omitted)
+
+    Returns:
+        RelevanceMatch with the score (0.0-1.0) and the matched terms
+    """
+    weights = weights or _DEFAULT_WEIGHTS
+    if profile is None:
+        profile = build_tool_profile(tool)
+
+    if isinstance(query, str):
+        query = prepare_query(query)
+    # Bound once; called per description, use case and example below
+    partial_ratio = fuzz.partial_ratio
+
+    score = 0.0
+
+    query_normalized = query.normalized
+    query_words = query.words
 
     # 1. Keyword matching (direct keyword hits)
-    keyword_hits = query_words & all_tool_words
+    keyword_hits = query_words & profile.all_words
     if keyword_hits:
-        keyword_score = min(1.0, len(keyword_hits) / max(1, len(query_words) / 2))
+        keyword_score = min(1.0, len(keyword_hits) / query.keyword_denominator)
         score += weights["keyword"] * keyword_score
-        if keyword_hits:
-            reasons.append(f"keyword match: {', '.join(sorted(keyword_hits)[:3])}")
 
-    # Also check for keyword matches with tool's explicit keywords
-    explicit_keyword_hits = query_words & tool.keywords
+    # Also check for keyword matches with tool's explicit keywords; they are
+    # a subset of all_words, so only the (few) keyword hits need checking
+    explicit_keyword_hits = keyword_hits & profile.keywords
     if explicit_keyword_hits:
         bonus = 0.1 * min(1.0, len(explicit_keyword_hits) / 2)
         score += bonus
 
     # 2. Action verb matching (with synonyms)
-    query_actions = {
-        _get_canonical_action(w) for w in query_words if _get_canonical_action(w)
-    }
-    tool_actions = {
-        _get_canonical_action(w) for w in tool_name_words if _get_canonical_action(w)
-    }
-
-    action_matches = query_actions & tool_actions
+    action_matches = query.actions & profile.actions
     if action_matches:
         action_score = min(1.0, len(action_matches))
         score += weights["action"] * action_score
-        reasons.append(f"action match: {', '.join(sorted(action_matches))}")
 
     # 3. Entity matching (with synonyms)
-    query_entities = {
-        _get_canonical_entity(w) for w in query_words if _get_canonical_entity(w)
-    }
-    tool_entities = {
-        _get_canonical_entity(w)
-        for w in (tool_name_words | tool_desc_words)
-        if _get_canonical_entity(w)
-    }
-    # Also include service as an entity
-    tool_entities.add(tool.service)
-
-    entity_matches = query_entities & tool_entities
+    entity_matches = query.entities & profile.entities
     if entity_matches:
         entity_score = min(1.0, len(entity_matches))
         score += weights["entity"] * entity_score
-        reasons.append(f"entity match: {', '.join(sorted(entity_matches))}")
 
-    # 4. Fuzzy description matching using thefuzz
+    match = RelevanceMatch(
+        score=0.0,
+        keyword_hits=keyword_hits,
+        action_matches=action_matches,
+        entity_matches=entity_matches,
+    )
+
+    # 4. Fuzzy description matching using rapidfuzz. Scores are rounded to
+    # whole percentages as thefuzz did; each score_cutoff sits at or below
+    # its threshold, so it only zeroes scores that would not count anyway
+    # and lets rapidfuzz stop early on them
     # Compare query to tool description
-    fuzzy_ratio = fuzz.partial_ratio(query_normalized, tool.description.lower())
+    fuzzy_ratio = round(
+        partial_ratio(query_normalized, profile.description_lower, score_cutoff=60)
+    )
     if fuzzy_ratio > 60:  # Only count significant fuzzy matches
         fuzzy_score = (fuzzy_ratio - 60) / 40.0  # Normalize 60-100 to 0-1
         score += weights["fuzzy"] * fuzzy_score
-        if fuzzy_ratio > 75:
-            reasons.append(f"description similarity: {fuzzy_ratio}%")
+        match.description_ratio = fuzzy_ratio
 
     # Also check tool name fuzzy match
-    name_fuzzy = fuzz.ratio(query_normalized, tool.name.lower().replace("_", " "))
+    name_fuzzy = round(
+        fuzz.ratio(query_normalized, profile.name_spaced, score_cutoff=50)
+    )
     if name_fuzzy > 50:
         name_bonus = (name_fuzzy - 50) / 100.0  # Small bonus for name match
         score += name_bonus * 0.1
 
     # 5. Use case matching
-    if tool.use_cases:
+    if profile.use_cases_lower:
         best_use_case_score = 0.0
         best_use_case = ""
-        for use_case in tool.use_cases:
-            use_case_ratio = fuzz.partial_ratio(query_normalized, use_case.lower())
+        for use_case, use_case_lower in profile.use_cases_lower:
+            use_case_ratio = round(
+                partial_ratio(query_normalized, use_case_lower, score_cutoff=70)
+            )
             if use_case_ratio > best_use_case_score:
                 best_use_case_score = use_case_ratio
                 best_use_case = use_case
@@ -202,16 +389,19 @@ def score_tool_relevance(
         if best_use_case_score > 70:
             use_case_score = (best_use_case_score - 70) / 30.0
             score += weights["use_case"] * use_case_score
-            if best_use_case_score > 80:
-                reasons.append(f"use case: '{best_use_case}'")
+            match.best_use_case = best_use_case
+            match.best_use_case_score = best_use_case_score
 
     # 6. Example matching (bonus)
-    if tool.examples:
-        for example in tool.examples:
-            example_ratio = fuzz.partial_ratio(query_normalized, example.lower())
+    if profile.examples_lower:
+        for example, example_lower in profile.examples_lower:
+            example_ratio = round(
+                partial_ratio(query_normalized, example_lower, score_cutoff=80)
+            )
             if example_ratio > 80:
                 score += 0.05  # Small bonus for example match
-                reasons.append(f"similar to example: '{example[:40]}...'")
+                match.matched_example = example
                 break
 
-    return min(1.0, score), reasons
+    match.score = min(1.0, score)
+    return match
@@ -1,9 +1,9 @@
 """Data types for tool discovery."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolIndexEntry:
     """Indexed tool information for discovery."""
 
@@ -11,14 +11,14 @@ class ToolIndexEntry:
     description: str
     service: str  # "jira", "confluence", "bitbucket", "composite"
     is_write: bool
-    tags: set[str]
-    parameters: list[str]
-    use_cases: list[str] = field(default_factory=list)
-    examples: list[str] = field(default_factory=list)
-    keywords: set[str] = field(default_factory=set)
+    tags: frozenset[str]
+    parameters: tuple[str, ...]
+    use_cases: tuple[str, ...] = ()
+    examples: tuple[str, ...] = ()
+    keywords: frozenset[str] = frozenset()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolRecommendation:
     """A recommended tool with relevance score."""
 
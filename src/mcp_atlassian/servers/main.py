@@ -375,18 +375,13 @@ logger.info("Added /healthz endpoint for Kubernetes probes")
 # Tool Discovery Meta-Tool
 # =============================================================================
 
-# Singleton instance for the tool discovery index
-_discovery_index: "ToolDiscoveryIndex | None" = None
-
 
 @main_mcp.tool(tags={"meta", "read"})
 async def discover_tools(
     ctx: Context,
     task: Annotated[
         str,
-        Field(
-            description="Natural language description of what you want to do."
-        ),
+        Field(description="Natural language description of what you want to do."),
     ],
     service_filter: Annotated[
         str | None,
@@ -427,18 +422,15 @@ async def discover_tools(
     Returns:
         JSON array of recommended tools with relevance scores and reasons.
     """
-    global _discovery_index
-
-    from mcp_atlassian.servers.discovery import ToolDiscoveryIndex
+    from mcp_atlassian.servers.discovery import get_discovery_index
 
-    if _discovery_index is None:
-        _discovery_index = ToolDiscoveryIndex()
+    discovery_index = get_discovery_index()
 
-    if not _discovery_index.is_built:
+    if not discovery_index.is_built:
         # Build index from main_mcp (includes mounted sub-servers)
-        await _discovery_index.build_index(main_mcp)
+        await discovery_index.build_index(main_mcp)
 
-    recommendations = _discovery_index.search(
+    recommendations = discovery_index.search(
         query=task,
         service_filter=service_filter,
         include_write=include_write_tools,
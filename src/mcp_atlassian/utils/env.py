@@ -1,7 +1,10 @@
 """Environment variable utility functions for MCP Atlassian."""
 
+import logging
 import os
 
+logger = logging.getLogger("mcp-atlassian.utils.env")
+
 
 def is_env_truthy(env_var_name: str, default: str = "") -> bool:
     """Check if environment variable is set to a standard truthy value.
@@ -35,6 +38,34 @@ def is_env_extended_truthy(env_var_name: str, default: str = "") -> bool:
     return os.getenv(env_var_name, default).lower() in ("true", "1", "yes", "y", "on")
 
 
+def get_env_positive_int(env_var_name: str, default: int) -> int:
+    """Read a positive integer from an environment variable.
+
+    Invalid or non-positive values are logged and replaced by the default
+    so that a typo in an optional tuning knob never stops the server.
+
+    Args:
+        env_var_name: Name of the environment variable to read
+        default: Value used when the variable is unset or invalid
+
+    Returns:
+        The parsed integer, or the default
+    """
+    env_val = os.getenv(env_var_name)
+    if env_val is None or not env_val.strip():
+        return default
+    try:
+        value = int(env_val)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning(
+            f"Invalid positive integer for {env_var_name}: {env_val}, using {default}"
+        )
+        return default
+    return value
+
+
 def is_env_ssl_verify(env_var_name: str, default: str = "true") -> bool:
     """Check SSL verification setting with secure defaults.
 
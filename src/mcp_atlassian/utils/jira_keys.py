@@ -2,13 +2,32 @@
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 
 # Pattern matches: PROJ-123, ABC-1, A-1, TEAM_NAME-9999
 # Jira project keys must start with a letter, optionally followed by letters, digits, or underscores
-JIRA_KEY_PATTERN = re.compile(r'\b([A-Z][A-Z0-9_]*-\d+)\b')
+JIRA_KEY_PATTERN = re.compile(r"\b([A-Z][A-Z0-9_]*-\d+)\b")
 
+# Case-insensitive twin used for scanning free text, so only the short matched
+# key is upper-cased instead of a full copy of the text (explicit classes are
+# faster than re.IGNORECASE in sre)
+_ANY_CASE_KEY_PATTERN = re.compile(r"\b([A-Za-z][A-Za-z0-9_]*-\d+)\b")
 
-@dataclass
+# A whole identifier that is a Jira key, in any case
+_JIRA_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9_]*-\d+")
+
+# Bitbucket identifiers: PROJECT/repo#123 or PROJECT/repo (used with fullmatch)
+_BITBUCKET_IDENTIFIER_PATTERN = re.compile(
+    r"([A-Z][A-Z0-9_]*)/([a-z0-9][a-z0-9._-]*)(?:#(\d+))?", re.IGNORECASE
+)
+
+# Every key contains this, so texts without it are skipped before the
+# upper-case copy and regex scan
+_KEY_SEPARATOR = "-"
+
+
+@dataclass(slots=True, frozen=True)
 class JiraKeyMatch:
     """A matched Jira issue key with confidence score."""
 
@@ -17,6 +36,14 @@ class JiraKeyMatch:
     confidence: float  # 0.0 to 1.0
 
 
+# (source, confidence) per field, in the order the fields are joined for the
+# single scan in extract_jira_keys; that order is also descending confidence
+_KEY_SOURCES = (("title", 1.0), ("branch", 0.9), ("description", 0.7))
+
+# Joins the scanned fields; a non-word character, so keys never span two fields
+_FIELD_SEPARATOR = "\x01"
+
+
 def extract_jira_keys(
     title: str | None = None,
     description: str | None = None,
@@ -38,46 +65,40 @@ def extract_jira_keys(
     Returns:
         List of JiraKeyMatch objects sorted by confidence (highest first).
     """
-    matches: dict[str, JiraKeyMatch] = {}
-
-    # Extract from title (highest confidence)
-    if title:
-        for match in JIRA_KEY_PATTERN.finditer(title.upper()):
-            key = match.group(1)
-            if key not in matches or matches[key].confidence < 1.0:
-                matches[key] = JiraKeyMatch(key=key, source="title", confidence=1.0)
-
-    # Extract from branch name (high confidence)
-    if branch_name:
-        # Normalize branch name: replace common separators with spaces for matching
-        normalized_branch = branch_name.upper().replace("/", " ").replace("-", " ")
-        # Also try the original format as Jira keys can appear as feature/PROJ-123
-        for text in [branch_name.upper(), normalized_branch]:
-            for match in JIRA_KEY_PATTERN.finditer(text):
-                key = match.group(1)
-                if key not in matches or matches[key].confidence < 0.9:
-                    matches[key] = JiraKeyMatch(
-                        key=key, source="branch", confidence=0.9
-                    )
-
-    # Extract from description (lower confidence)
-    if description:
-        for match in JIRA_KEY_PATTERN.finditer(description.upper()):
-            key = match.group(1)
-            if key not in matches or matches[key].confidence < 0.7:
-                matches[key] = JiraKeyMatch(
-                    key=key, source="description", confidence=0.7
-                )
-
-    # Sort by confidence (highest first), then by key for deterministic order
-    return sorted(
-        matches.values(), key=lambda m: (-m.confidence, m.key)
-    )
-
+    fields = (title or "", branch_name or "", description or "")
+    text = _FIELD_SEPARATOR.join(fields)
+    if _KEY_SEPARATOR not in text:
+        return []
 
-@dataclass
+    # One scan over the joined fields; a match's offset tells which field it
+    # came from. Fields are joined in descending confidence, so the lowest
+    # field index seen for a key is its best source
+    title_end = len(fields[0])
+    branch_end = title_end + 1 + len(fields[1])
+    best: dict[str, int] = {}
+    for match in _ANY_CASE_KEY_PATTERN.finditer(text):
+        start = match.start()
+        field = 0 if start < title_end else 1 if start < branch_end else 2
+        key = match.group(1).upper()
+        if best.get(key, len(_KEY_SOURCES)) > field:
+            best[key] = field
+
+    # Integer field ranks sort like descending confidence; itemgetter builds
+    # the (rank, key) sort key in C
+    results: list[JiraKeyMatch] = []
+    for key, field in sorted(best.items(), key=itemgetter(1, 0)):
+        source, confidence = _KEY_SOURCES[field]
+        results.append(JiraKeyMatch(key=key, source=source, confidence=confidence))
+    return results
+
+
+@dataclass(slots=True, frozen=True)
 class DevelopmentIdentifier:
-    """Parsed development identifier."""
+    """Parsed development identifier.
+
+    Frozen so that cached results of parse_development_identifier can be
+    shared safely between callers.
+    """
 
     type: str  # "jira" or "bitbucket"
     # For Jira: issue_key
@@ -88,6 +109,7 @@ class DevelopmentIdentifier:
     pr_id: int | None = None
 
 
+@lru_cache(maxsize=4096)
 def parse_development_identifier(identifier: str) -> DevelopmentIdentifier:
     """Parse smart identifier into structured format.
 
@@ -96,6 +118,8 @@ def parse_development_identifier(identifier: str) -> DevelopmentIdentifier:
     - "PROJ/my-repo#456" -> Bitbucket PR
     - "PROJ/my-repo" -> Bitbucket repo (no PR)
 
+    Results are memoized; invalid identifiers raise on every call.
+
     Args:
         identifier: Smart identifier string
 
@@ -110,27 +134,23 @@ def parse_development_identifier(identifier: str) -> DevelopmentIdentifier:
     if not identifier:
         raise ValueError("Identifier cannot be empty")
 
-    # Check for Bitbucket PR format: PROJECT/repo#123 or PROJECT/repo
-    bitbucket_pattern = re.compile(
-        r'^([A-Z][A-Z0-9_]*)/([a-z0-9][a-z0-9._-]*)(?:#(\d+))?$',
-        re.IGNORECASE
-    )
-    bb_match = bitbucket_pattern.match(identifier)
-    if bb_match:
-        project_key = bb_match.group(1).upper()
-        repo_slug = bb_match.group(2).lower()
-        pr_id_str = bb_match.group(3)
-        pr_id = int(pr_id_str) if pr_id_str else None
-        return DevelopmentIdentifier(
-            type="bitbucket",
-            project_key=project_key,
-            repo_slug=repo_slug,
-            pr_id=pr_id,
-        )
-
-    # Check for Jira issue format: PROJ-123
-    jira_match = JIRA_KEY_PATTERN.match(identifier.upper())
-    if jira_match and jira_match.group(0) == identifier.upper():
+    # Only Bitbucket identifiers contain "/", so one regex is tried per call
+    if "/" in identifier:
+        # Bitbucket PR format: PROJECT/repo#123 or PROJECT/repo
+        bb_match = _BITBUCKET_IDENTIFIER_PATTERN.fullmatch(identifier)
+        if bb_match:
+            project_key = bb_match.group(1).upper()
+            repo_slug = bb_match.group(2).lower()
+            pr_id_str = bb_match.group(3)
+            pr_id = int(pr_id_str) if pr_id_str else None
+            return DevelopmentIdentifier(
+                type="bitbucket",
+                project_key=project_key,
+                repo_slug=repo_slug,
+                pr_id=pr_id,
+            )
+    # Jira issue format: PROJ-123
+    elif _JIRA_IDENTIFIER_PATTERN.fullmatch(identifier):
         return DevelopmentIdentifier(
             type="jira",
             issue_key=identifier.upper(),
@@ -154,11 +174,8 @@ def get_jira_keys_from_text(text: str) -> list[str]:
     Returns:
         List of unique Jira issue keys found in the text
     """
-    if not text:
+    if not text or _KEY_SEPARATOR not in text:
         return []
 
-    keys = set()
-    for match in JIRA_KEY_PATTERN.finditer(text.upper()):
-        keys.add(match.group(1))
-
-    return sorted(keys)
+    # One capture group, so findall yields the key strings without Match objects
+    return sorted({key.upper() for key in _ANY_CASE_KEY_PATTERN.findall(text)})
@@ -1,24 +1,45 @@
 """Rate limiting utilities for MCP Atlassian.
 
-This module provides token bucket rate limiting with exponential backoff
-for handling HTTP 429 responses from Atlassian APIs.
+This module provides token bucket and sliding-window rate limiting with
+exponential backoff for handling HTTP 429 responses from Atlassian APIs.
 """
 
 import asyncio
+import functools
 import logging
 import os
+import re
 import time
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable
+from dataclasses import astuple, dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from threading import Lock
-from typing import Any
+from typing import Any, ClassVar, TypeVar
 
 from requests import PreparedRequest, Response, Session
 from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger("mcp-atlassian.rate_limit")
 
+_N = TypeVar("_N", int, float)
 
-@dataclass
+# Supported limiter algorithms for RateLimitConfig.algorithm
+TOKEN_BUCKET = "token_bucket"  # noqa: S105 - algorithm name, not a secret
+SLIDING_WINDOW = "sliding_window"
+_ALGORITHMS = (TOKEN_BUCKET, SLIDING_WINDOW)
+
+# Services that default to a non token-bucket algorithm
+_DEFAULT_SERVICE_ALGORITHMS = {"bitbucket": SLIDING_WINDOW}
+
+# Retry-After as (possibly fractional) seconds; matched instead of calling
+# float() so unparseable values are rejected without raising, and values like
+# "inf" or "-1" that float() would accept are never used as a delay
+_RETRY_AFTER_SECONDS = re.compile(r"\d+(?:\.\d+)?")
+
+
+@dataclass(slots=True, frozen=True)
 class RateLimitConfig:
     """Configuration for rate limiting behavior.
 
@@ -27,12 +48,58 @@ class RateLimitConfig:
         burst_capacity: Maximum number of tokens in the bucket (default 20)
         backoff_base: Base delay in seconds for exponential backoff (default 1.0)
         max_retries: Maximum number of retry attempts for 429 responses (default 5)
+        algorithm: Limiter algorithm, "token_bucket" or "sliding_window"
+                  (default "token_bucket")
+
+    Frozen, so the shared ``RateLimitConfig.DEFAULT`` instance can be handed
+    out wherever the defaults apply.
     """
 
+    DEFAULT: ClassVar["RateLimitConfig"]
+
     requests_per_second: float = 10.0
     burst_capacity: int = 20
     backoff_base: float = 1.0
     max_retries: int = 5
+    algorithm: str = TOKEN_BUCKET
+
+
+RateLimitConfig.DEFAULT = RateLimitConfig()
+_DEFAULT_CONFIG_VALUES = astuple(RateLimitConfig.DEFAULT)
+
+
+def _env_number(
+    suffix: str,
+    service_prefix: str | None,
+    default: _N,
+    caster: type[_N],
+    is_valid: Callable[[_N], bool] | None = None,
+) -> _N:
+    """Read ATLASSIAN_{suffix}, overridden by {service_prefix}{suffix} if set.
+
+    Values that fail to parse, or that ``is_valid`` rejects, are logged and
+    ignored in favour of the previous value.
+    """
+    value = default
+    for key, fallback in (
+        (f"ATLASSIAN_{suffix}", "default"),
+        (f"{service_prefix}{suffix}" if service_prefix else None, "global/default"),
+    ):
+        env_val = os.getenv(key) if key else None
+        if not env_val:
+            continue
+        try:
+            parsed = caster(env_val)
+        except ValueError:
+            parsed = None
+        if parsed is None or (is_valid is not None and not is_valid(parsed)):
+            logger.warning(
+                f"Invalid {caster.__name__} value for {key}: {env_val}, "
+                f"using {fallback}"
+            )
+            continue
+        value = parsed
+    return value
 
 
 def get_config_from_env(service_name: str | None = None) -> RateLimitConfig:
@@ -53,92 +120,65 @@ def get_config_from_env(service_name: str | None = None) -> RateLimitConfig:
         ATLASSIAN_RATE_LIMIT_BURST: Global burst capacity (default 20)
         ATLASSIAN_RATE_LIMIT_BACKOFF_BASE: Global backoff base (default 1.0)
         ATLASSIAN_RATE_LIMIT_MAX_RETRIES: Global max retries (default 5)
+        ATLASSIAN_RATE_LIMIT_ALGORITHM: Global limiter algorithm
+            (default "token_bucket"; "sliding_window" for Bitbucket)
         {SERVICE}_RATE_LIMIT_RPS: Service-specific requests per second
         {SERVICE}_RATE_LIMIT_BURST: Service-specific burst capacity
         {SERVICE}_RATE_LIMIT_BACKOFF_BASE: Service-specific backoff base
         {SERVICE}_RATE_LIMIT_MAX_RETRIES: Service-specific max retries
+        {SERVICE}_RATE_LIMIT_ALGORITHM: Service-specific limiter algorithm
     """
 
-    def get_float(
-        global_key: str, service_key: str | None, default: float
-    ) -> float:
-        """Get float value from environment with service override."""
-        value = default
-        global_val = os.getenv(global_key)
-        if global_val:
-            try:
-                value = float(global_val)
-            except ValueError:
-                logger.warning(
-                    f"Invalid float value for {global_key}: {global_val}, using default"
-                )
-        if service_key:
-            service_val = os.getenv(service_key)
-            if service_val:
-                try:
-                    value = float(service_val)
-                except ValueError:
-                    logger.warning(
-                        f"Invalid float value for {service_key}: {service_val}, "
-                        f"using global/default"
-                    )
-        return value
-
-    def get_int(global_key: str, service_key: str | None, default: int) -> int:
-        """Get int value from environment with service override."""
-        value = default
-        global_val = os.getenv(global_key)
-        if global_val:
-            try:
-                value = int(global_val)
-            except ValueError:
-                logger.warning(
-                    f"Invalid int value for {global_key}: {global_val}, using default"
-                )
-        if service_key:
-            service_val = os.getenv(service_key)
-            if service_val:
-                try:
-                    value = int(service_val)
-                except ValueError:
-                    logger.warning(
-                        f"Invalid int value for {service_key}: {service_val}, "
-                        f"using global/default"
-                    )
-        return value
-
     # Build service-specific env var names if service name provided
     service_prefix = f"{service_name.upper()}_" if service_name else None
 
-    rps = get_float(
-        "ATLASSIAN_RATE_LIMIT_RPS",
-        f"{service_prefix}RATE_LIMIT_RPS" if service_prefix else None,
-        10.0,
-    )
-    burst = get_int(
-        "ATLASSIAN_RATE_LIMIT_BURST",
-        f"{service_prefix}RATE_LIMIT_BURST" if service_prefix else None,
-        20,
-    )
-    backoff = get_float(
-        "ATLASSIAN_RATE_LIMIT_BACKOFF_BASE",
-        f"{service_prefix}RATE_LIMIT_BACKOFF_BASE" if service_prefix else None,
-        1.0,
-    )
-    max_retries = get_int(
-        "ATLASSIAN_RATE_LIMIT_MAX_RETRIES",
-        f"{service_prefix}RATE_LIMIT_MAX_RETRIES" if service_prefix else None,
-        5,
+    # The limiters divide by the rate and index into a burst-sized window, so
+    # a non-positive rate or an empty burst is rejected like a parse error
+    rps = _env_number("RATE_LIMIT_RPS", service_prefix, 10.0, float, lambda v: v > 0)
+    burst = _env_number("RATE_LIMIT_BURST", service_prefix, 20, int, lambda v: v >= 1)
+    backoff = _env_number("RATE_LIMIT_BACKOFF_BASE", service_prefix, 1.0, float)
+    max_retries = _env_number("RATE_LIMIT_MAX_RETRIES", service_prefix, 5, int)
+
+    algorithm = _DEFAULT_SERVICE_ALGORITHMS.get(
+        service_name.lower() if service_name else "", TOKEN_BUCKET
     )
+    for key in (
+        "ATLASSIAN_RATE_LIMIT_ALGORITHM",
+        f"{service_prefix}RATE_LIMIT_ALGORITHM" if service_prefix else None,
+    ):
+        env_val = os.getenv(key) if key else None
+        if not env_val:
+            continue
+        if env_val.lower() in _ALGORITHMS:
+            algorithm = env_val.lower()
+        else:
+            logger.warning(
+                f"Invalid algorithm for {key}: {env_val}, "
+                f"expected one of {', '.join(_ALGORITHMS)}"
+            )
 
+    if (rps, burst, backoff, max_retries, algorithm) == _DEFAULT_CONFIG_VALUES:
+        return RateLimitConfig.DEFAULT
     return RateLimitConfig(
         requests_per_second=rps,
         burst_capacity=burst,
         backoff_base=backoff,
         max_retries=max_retries,
+        algorithm=algorithm,
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_config_from_env(service_name: str | None) -> RateLimitConfig:
+    """Return the environment config for a service, parsed once per process.
+
+    Environment variables do not change at runtime, so the registry and
+    ``configure_rate_limiting`` share this cache instead of re-reading them
+    for every session. ``RateLimiterRegistry.reset`` clears it.
+    """
+    return get_config_from_env(service_name)
+
+
 class TokenBucket:
     """Token bucket rate limiter with async and sync support.
 
@@ -158,38 +198,63 @@ class TokenBucket:
             config: Rate limit configuration
         """
         self.config = config
-        self.tokens: float = float(config.burst_capacity)
-        self.last_refill: float = time.monotonic()
+        # (tokens, last_refill) is rebound as one immutable tuple under _lock,
+        # so readers get a consistent snapshot without taking the lock
+        self._state: tuple[float, float] = (
+            float(config.burst_capacity),
+            time.monotonic(),
+        )
         self._lock = Lock()
-        self._async_lock: asyncio.Lock | None = None
 
-    def _get_async_lock(self) -> asyncio.Lock:
-        """Get or create the async lock (lazy initialization)."""
-        if self._async_lock is None:
-            self._async_lock = asyncio.Lock()
-        return self._async_lock
+    @property
+    def tokens(self) -> float:
+        """Number of tokens available as of the last refill."""
+        return self._state[0]
+
+    @property
+    def last_refill(self) -> float:
+        """Monotonic timestamp of the last refill."""
+        return self._state[1]
+
+    def _refilled(self, now: float) -> float:
+        """Return the token count at ``now`` from the current state snapshot."""
+        tokens, last_refill = self._state
+        tokens_to_add = (now - last_refill) * self.config.requests_per_second
+        return min(self.config.burst_capacity, tokens + tokens_to_add)
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time since last refill."""
         now = time.monotonic()
-        elapsed = now - self.last_refill
-        tokens_to_add = elapsed * self.config.requests_per_second
-        self.tokens = min(self.config.burst_capacity, self.tokens + tokens_to_add)
-        self.last_refill = now
+        self._state = (self._refilled(now), now)
+
+    def _try_acquire_locked(self) -> float:
+        """Consume a token if one is available; the caller holds ``_lock``.
+
+        Returns:
+            0.0 if a token was consumed, otherwise the time in seconds until
+            the next token becomes available.
+        """
+        now = time.monotonic()
+        tokens = self._refilled(now)
+        if tokens >= 1.0:
+            self._state = (tokens - 1.0, now)
+            return 0.0
+        self._state = (tokens, now)
+        return (1.0 - tokens) / self.config.requests_per_second
 
     def get_wait_time(self) -> float:
         """Calculate time to wait for next available token.
 
+        This only reads a snapshot of the bucket, so it does not take the lock.
+
         Returns:
             Time in seconds to wait, or 0.0 if a token is available.
         """
-        with self._lock:
-            self._refill()
-            if self.tokens >= 1.0:
-                return 0.0
-            # Calculate time needed to refill to 1 token
-            tokens_needed = 1.0 - self.tokens
-            return tokens_needed / self.config.requests_per_second
+        tokens = self._refilled(time.monotonic())
+        if tokens >= 1.0:
+            return 0.0
+        # Calculate time needed to refill to 1 token
+        return (1.0 - tokens) / self.config.requests_per_second
 
     def try_acquire(self) -> bool:
         """Attempt to acquire a token without waiting.
@@ -198,11 +263,7 @@ class TokenBucket:
             True if a token was acquired, False otherwise.
         """
         with self._lock:
-            self._refill()
-            if self.tokens >= 1.0:
-                self.tokens -= 1.0
-                return True
-            return False
+            return self._try_acquire_locked() == 0.0
 
     def acquire(self) -> None:
         """Acquire a token, blocking if necessary.
@@ -210,42 +271,157 @@ class TokenBucket:
         This method will block until a token is available.
         """
         while True:
-            wait_time = self.get_wait_time()
+            with self._lock:
+                wait_time = self._try_acquire_locked()
             if wait_time <= 0:
-                if self.try_acquire():
-                    return
-            else:
-                time.sleep(wait_time)
+                return
+            time.sleep(wait_time)
 
     async def acquire_async(self) -> None:
         """Acquire a token asynchronously, waiting if necessary.
 
-        This method will await until a token is available.
+        This method will await until a token is available. Token state is
+        guarded by the thread lock, so waiting tasks sleep concurrently.
+        """
+        while True:
+            with self._lock:
+                wait_time = self._try_acquire_locked()
+            if wait_time <= 0:
+                return
+            await asyncio.sleep(wait_time)
+
+
+class SlidingWindowLimiter:
+    """Sliding-window rate limiter with async and sync support.
+
+    Allows at most ``burst_capacity`` requests in any window of
+    ``burst_capacity / requests_per_second`` seconds, so the long-run rate
+    matches the token bucket while bursts never straddle a window edge.
+    Checking and recording a request happen in one critical section.
+
+    Attributes:
+        config: Rate limit configuration
+        window: Window length in seconds
+        max_requests: Maximum number of requests per window
+    """
+
+    def __init__(self, config: RateLimitConfig) -> None:
+        """Initialize the sliding window.
+
+        Args:
+            config: Rate limit configuration
+        """
+        self.config = config
+        self.max_requests: int = config.burst_capacity
+        self.window: float = config.burst_capacity / config.requests_per_second
+        self._timestamps: deque[float] = deque()
+        self._lock = Lock()
+
+    def _consume_or_wait(self, now: float) -> float:
+        """Record a request at ``now`` if the window has room.
+
+        Args:
+            now: Current monotonic timestamp
+
+        Returns:
+            0.0 if the request was recorded, otherwise the time in seconds
+            until the oldest request leaves the window.
+        """
+        with self._lock:
+            timestamps = self._timestamps
+            cutoff = now - self.window
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+            if len(timestamps) < self.max_requests:
+                timestamps.append(now)
+                return 0.0
+            return timestamps[0] - cutoff
+
+    def try_consume(self, now: float | None = None) -> bool:
+        """Attempt to record a request without waiting.
+
+        Args:
+            now: Optional monotonic timestamp (defaults to the current time)
+
+        Returns:
+            True if the request fits in the window, False otherwise.
+        """
+        if now is None:
+            now = time.monotonic()
+        return self._consume_or_wait(now) == 0.0
+
+    def try_acquire(self) -> bool:
+        """Attempt to acquire a slot without waiting.
+
+        Returns:
+            True if a slot was acquired, False otherwise.
+        """
+        return self.try_consume()
+
+    def get_wait_time(self) -> float:
+        """Calculate time to wait for the next available slot.
+
+        Returns:
+            Time in seconds to wait, or 0.0 if a slot is available.
+        """
+        with self._lock:
+            timestamps = self._timestamps
+            cutoff = time.monotonic() - self.window
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+            if len(timestamps) < self.max_requests:
+                return 0.0
+            return timestamps[0] - cutoff
+
+    def acquire(self) -> None:
+        """Acquire a slot, blocking if necessary.
+
+        This method will block until a slot is available.
         """
-        async with self._get_async_lock():
-            while True:
-                wait_time = self.get_wait_time()
-                if wait_time <= 0:
-                    if self.try_acquire():
-                        return
-                else:
-                    await asyncio.sleep(wait_time)
+        while True:
+            wait_time = self._consume_or_wait(time.monotonic())
+            if wait_time <= 0:
+                return
+            time.sleep(wait_time)
+
+    async def acquire_async(self) -> None:
+        """Acquire a slot asynchronously, waiting if necessary.
+
+        This method will await until a slot is available. Window state is
+        guarded by the thread lock, so waiting tasks sleep concurrently.
+        """
+        while True:
+            wait_time = self._consume_or_wait(time.monotonic())
+            if wait_time <= 0:
+                return
+            await asyncio.sleep(wait_time)
+
+
+RateLimiter = TokenBucket | SlidingWindowLimiter
+
+
+def _create_limiter(config: RateLimitConfig) -> RateLimiter:
+    """Create the limiter selected by ``config.algorithm``."""
+    if config.algorithm == SLIDING_WINDOW:
+        return SlidingWindowLimiter(config)
+    return TokenBucket(config)
 
 
 class RateLimitedAdapter(HTTPAdapter):
     """HTTP adapter that implements rate limiting with retry on 429.
 
     This adapter wraps requests to enforce rate limiting using a token bucket
-    and handles HTTP 429 (Too Many Requests) responses with exponential backoff.
+    or sliding window and handles HTTP 429 (Too Many Requests) responses with
+    exponential backoff.
 
     Attributes:
-        rate_limiter: TokenBucket instance for rate limiting
+        rate_limiter: TokenBucket or SlidingWindowLimiter for rate limiting
         config: Rate limit configuration
     """
 
     def __init__(
         self,
-        rate_limiter: TokenBucket,
+        rate_limiter: RateLimiter,
         config: RateLimitConfig | None = None,
         *args: Any,
         **kwargs: Any,
@@ -253,7 +429,7 @@ class RateLimitedAdapter(HTTPAdapter):
         """Initialize the rate limited adapter.
 
         Args:
-            rate_limiter: TokenBucket instance for rate limiting
+            rate_limiter: TokenBucket or SlidingWindowLimiter for rate limiting
             config: Optional rate limit configuration (uses rate_limiter's config
                    if None)
             *args: Additional positional arguments for HTTPAdapter
@@ -288,12 +464,20 @@ class RateLimitedAdapter(HTTPAdapter):
         Raises:
             Exception: If max retries exceeded on 429 responses
         """
+        # The config is frozen and fixed for the adapter's lifetime, so the
+        # values the retry loop needs are bound once per call
+        acquire = self.rate_limiter.acquire
+        max_retries = self.config.max_retries
+        backoff_base = self.config.backoff_base
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         retries = 0
         while True:
             # Acquire rate limit token before sending
-            self.rate_limiter.acquire()
+            acquire()
 
-            logger.debug(f"Sending request to {request.url}")
+            if debug_enabled:
+                logger.debug(f"Sending request to {request.url}")
             response = super().send(
                 request,
                 stream=stream,
@@ -308,11 +492,8 @@ class RateLimitedAdapter(HTTPAdapter):
 
             # Handle rate limit response
             retries += 1
-            if retries > self.config.max_retries:
-                logger.error(
-                    f"Max retries ({self.config.max_retries}) exceeded for "
-                    f"{request.url}"
-                )
+            if retries > max_retries:
+                logger.error(f"Max retries ({max_retries}) exceeded for {request.url}")
                 return response
 
             # Calculate backoff time
@@ -321,14 +502,14 @@ class RateLimitedAdapter(HTTPAdapter):
                 wait_time = retry_after
                 logger.warning(
                     f"Rate limited (429), Retry-After: {wait_time}s, "
-                    f"attempt {retries}/{self.config.max_retries}"
+                    f"attempt {retries}/{max_retries}"
                 )
             else:
-                # Exponential backoff
-                wait_time = self.config.backoff_base * (2 ** (retries - 1))
+                # Exponential backoff; retries >= 1 here, so the shift is safe
+                wait_time = backoff_base * (1 << (retries - 1))
                 logger.warning(
                     f"Rate limited (429), exponential backoff: {wait_time}s, "
-                    f"attempt {retries}/{self.config.max_retries}"
+                    f"attempt {retries}/{max_retries}"
                 )
 
             time.sleep(wait_time)
@@ -346,56 +527,68 @@ class RateLimitedAdapter(HTTPAdapter):
         if retry_after is None:
             return None
 
-        try:
-            # Try parsing as seconds (integer)
+        retry_after = retry_after.strip()
+        # Atlassian sends seconds, so that form is checked first
+        if _RETRY_AFTER_SECONDS.fullmatch(retry_after):
             return float(retry_after)
-        except ValueError:
-            pass
 
-        # Could also try parsing as HTTP-date, but Atlassian typically uses seconds
+        # HTTP-date form (IMF-fixdate and RFC 850 both end in GMT)
+        if retry_after.endswith("GMT"):
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                pass
+            else:
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                return max(0.0, delay)
+
         logger.debug(f"Could not parse Retry-After header: {retry_after}")
         return None
 
 
 class RateLimiterRegistry:
-    """Singleton registry for per-service rate limiters.
+    """Registry for per-service rate limiters.
 
     This class manages rate limiters for different Atlassian services,
     allowing service-specific rate limit configurations while sharing
-    rate limiters across multiple sessions for the same service.
+    rate limiters across multiple sessions for the same service. The
+    process-wide instance is returned by ``get_rate_limiter_registry``.
     """
 
-    _instance: "RateLimiterRegistry | None" = None
-    _lock = Lock()
-
-    def __new__(cls) -> "RateLimiterRegistry":
-        """Ensure singleton instance."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._limiters: dict[str, TokenBucket] = {}
-                    cls._instance._configs: dict[str, RateLimitConfig] = {}
-        return cls._instance
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._limiters: dict[str, RateLimiter] = {}
+        self._configs: dict[str, RateLimitConfig] = {}
+        self._registry_lock = Lock()
 
-    def get_limiter(self, service_name: str) -> TokenBucket:
+    def get_limiter(self, service_name: str) -> RateLimiter:
         """Get or create a rate limiter for a service.
 
         Args:
             service_name: Service name (e.g., "jira", "confluence", "bitbucket")
 
         Returns:
-            TokenBucket rate limiter for the service
+            Rate limiter for the service, as selected by its config's algorithm
         """
         service_key = service_name.lower()
-        if service_key not in self._limiters:
-            config = self._configs.get(service_key, get_config_from_env(service_key))
-            self._limiters[service_key] = TokenBucket(config)
-            logger.debug(
-                f"Created rate limiter for {service_name}: "
-                f"{config.requests_per_second} RPS, burst {config.burst_capacity}"
-            )
-        return self._limiters[service_key]
+        limiter = self._limiters.get(service_key)
+        if limiter is not None:
+            return limiter
+        with self._registry_lock:
+            # Another thread may have created it while we waited for the lock
+            limiter = self._limiters.get(service_key)
+            if limiter is None:
+                config = self._configs.get(service_key) or _cached_config_from_env(
+                    service_key
+                )
+                limiter = _create_limiter(config)
+                self._limiters[service_key] = limiter
+                logger.debug(
+                    f"Created rate limiter for {service_name}: "
+                    f"{config.requests_per_second} RPS, "
+                    f"burst {config.burst_capacity}"
+                )
+        return limiter
 
     def configure(self, service_name: str, config: RateLimitConfig) -> None:
         """Configure rate limiting for a service.
@@ -407,34 +600,47 @@ class RateLimiterRegistry:
             config: Rate limit configuration for the service
         """
         service_key = service_name.lower()
-        self._configs[service_key] = config
-        # If limiter already exists, replace it with new config
-        if service_key in self._limiters:
-            self._limiters[service_key] = TokenBucket(config)
-            logger.info(
-                f"Reconfigured rate limiter for {service_name}: "
-                f"{config.requests_per_second} RPS, burst {config.burst_capacity}"
-            )
+        with self._registry_lock:
+            self._configs[service_key] = config
+            # If limiter already exists, replace it with new config
+            if service_key in self._limiters:
+                self._limiters[service_key] = _create_limiter(config)
+                logger.info(
+                    f"Reconfigured rate limiter for {service_name}: "
+                    f"{config.requests_per_second} RPS, "
+                    f"burst {config.burst_capacity}"
+                )
 
     def reset(self) -> None:
         """Reset the registry (primarily for testing).
 
-        Clears all configured limiters and configurations.
+        Clears all configured limiters and configurations, and drops the
+        cached environment configs so changed variables are picked up.
         """
-        self._limiters.clear()
-        self._configs.clear()
+        with self._registry_lock:
+            self._limiters.clear()
+            self._configs.clear()
+            _cached_config_from_env.cache_clear()
+
+
+_REGISTRY = RateLimiterRegistry()
 
 
 def get_rate_limiter_registry() -> RateLimiterRegistry:
     """Get the global rate limiter registry.
 
     Returns:
-        The singleton RateLimiterRegistry instance.
+        The process-wide RateLimiterRegistry instance.
     """
-    return RateLimiterRegistry()
+    return _REGISTRY
 
 
-def configure_rate_limiting(session: Session, service_name: str) -> None:
+def configure_rate_limiting(
+    session: Session,
+    service_name: str,
+    pool_connections: int | None = None,
+    pool_maxsize: int | None = None,
+) -> None:
     """Configure rate limiting for a requests session.
 
     This is the main integration function that mounts a RateLimitedAdapter
@@ -443,14 +649,23 @@ def configure_rate_limiting(session: Session, service_name: str) -> None:
     Args:
         session: The requests Session to configure
         service_name: Service name (e.g., "jira", "confluence", "bitbucket")
+        pool_connections: Optional number of connection pools to cache
+                         (uses the HTTPAdapter default if None)
+        pool_maxsize: Optional maximum number of connections to keep per pool
+                     (uses the HTTPAdapter default if None)
     """
     registry = get_rate_limiter_registry()
     rate_limiter = registry.get_limiter(service_name)
-    config = registry._configs.get(
-        service_name.lower(), get_config_from_env(service_name)
-    )
+    service_key = service_name.lower()
+    config = registry._configs.get(service_key) or _cached_config_from_env(service_key)
+
+    pool_kwargs: dict[str, int] = {}
+    if pool_connections is not None:
+        pool_kwargs["pool_connections"] = pool_connections
+    if pool_maxsize is not None:
+        pool_kwargs["pool_maxsize"] = pool_maxsize
 
-    adapter = RateLimitedAdapter(rate_limiter, config)
+    adapter = RateLimitedAdapter(rate_limiter, config, **pool_kwargs)
 
     # Mount for all URLs (rate limiting is per-service, not per-domain)
     session.mount("https://", adapter)
@@ -1,10 +1,19 @@
 """Unit tests for the tool discovery index module."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
 
-from src.mcp_atlassian.servers.discovery.index import ToolDiscoveryIndex
+from src.mcp_atlassian.servers.discovery.index import (
+    ToolDiscoveryIndex,
+    get_discovery_index,
+)
+from src.mcp_atlassian.servers.discovery.scoring import (
+    RelevanceMatch,
+    match_tool_relevance,
+    prepare_query,
+)
 from src.mcp_atlassian.servers.discovery.types import ToolIndexEntry, ToolRecommendation
 
 
@@ -32,6 +41,14 @@ class TestToolDiscoveryIndexSingleton:
         index2 = ToolDiscoveryIndex()
         assert index1 is not index2
 
+    def test_get_discovery_index_returns_singleton(self):
+        """Test that get_discovery_index shares the instance and follows reset."""
+        index = get_discovery_index()
+        assert index is ToolDiscoveryIndex()
+        assert get_discovery_index() is index
+        ToolDiscoveryIndex.reset()
+        assert get_discovery_index() is not index
+
     def test_initial_state_not_built(self):
         """Test that a new index is not built."""
         index = ToolDiscoveryIndex()
@@ -125,6 +142,8 @@ class TestToolDiscoveryIndexBuild:
         assert "jira_create_issue" in all_tools
         assert "confluence_search" in all_tools
         assert "bitbucket_list_repositories" in all_tools
+        with pytest.raises(TypeError):
+            all_tools["new_tool"] = all_tools["jira_get_issue"]
 
     @pytest.mark.anyio
     async def test_build_index_extracts_service(self, mock_mcp_server):
@@ -169,6 +188,31 @@ class TestToolDiscoveryIndexBuild:
         assert "issue_key" in tool.parameters
         assert "fields" in tool.parameters
 
+    @pytest.mark.anyio
+    async def test_build_index_entries_are_compact(self, mock_mcp_server):
+        """Test that entries are slotted, hashable and share empty tuples."""
+        index = ToolDiscoveryIndex()
+        with patch("src.mcp_atlassian.servers.discovery.index.TOOL_ENHANCEMENTS", {}):
+            await index.build_index(mock_mcp_server)
+
+        entry = index.get_tool("confluence_search")
+        other = index.get_tool("jira_get_issue")
+        assert not hasattr(entry, "__dict__")
+        assert hash(entry) == hash(index.get_tool("confluence_search"))
+        assert entry.use_cases == () and entry.use_cases is other.use_cases
+        assert entry.examples is other.examples
+
+    @pytest.mark.anyio
+    async def test_concurrent_build_index_builds_once(self, mock_mcp_server):
+        """Test that concurrent builds fetch and index the tools only once."""
+        index = ToolDiscoveryIndex()
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(index.build_index, mock_mcp_server)
+
+        assert index.is_built
+        mock_mcp_server.get_tools.assert_awaited_once()
+
     @pytest.mark.anyio
     async def test_build_index_skips_if_already_built(self, mock_mcp_server):
         """Test that build_index is idempotent."""
@@ -197,66 +241,66 @@ class TestToolDiscoveryIndexSearch:
                 description="Get details of a specific Jira issue.",
                 service="jira",
                 is_write=False,
-                tags={"jira", "read"},
-                parameters=["issue_key", "fields"],
-                use_cases=["Look up issue details", "Check issue status"],
-                examples=["What's the status of PROJ-123?"],
-                keywords={"issue", "ticket", "bug", "details", "status"},
+                tags=frozenset({"jira", "read"}),
+                parameters=("issue_key", "fields"),
+                use_cases=("Look up issue details", "Check issue status"),
+                examples=("What's the status of PROJ-123?",),
+                keywords=frozenset({"issue", "ticket", "bug", "details", "status"}),
             ),
             "jira_search": ToolIndexEntry(
                 name="jira_search",
                 description="Search Jira issues using JQL.",
                 service="jira",
                 is_write=False,
-                tags={"jira", "read"},
-                parameters=["jql", "limit"],
-                use_cases=["Find issues by criteria", "Search for bugs"],
-                examples=["Find all bugs assigned to me"],
-                keywords={"search", "find", "query", "jql"},
+                tags=frozenset({"jira", "read"}),
+                parameters=("jql", "limit"),
+                use_cases=("Find issues by criteria", "Search for bugs"),
+                examples=("Find all bugs assigned to me",),
+                keywords=frozenset({"search", "find", "query", "jql"}),
             ),
             "jira_create_issue": ToolIndexEntry(
                 name="jira_create_issue",
                 description="Create a new Jira issue.",
                 service="jira",
                 is_write=True,
-                tags={"jira", "write"},
-                parameters=["project_key", "summary"],
-                use_cases=["Create a new ticket", "File a bug"],
-                examples=["Create a bug in PROJ"],
-                keywords={"create", "new", "add", "ticket"},
+                tags=frozenset({"jira", "write"}),
+                parameters=("project_key", "summary"),
+                use_cases=("Create a new ticket", "File a bug"),
+                examples=("Create a bug in PROJ",),
+                keywords=frozenset({"create", "new", "add", "ticket"}),
             ),
             "confluence_search": ToolIndexEntry(
                 name="confluence_search",
                 description="Search Confluence content.",
                 service="confluence",
                 is_write=False,
-                tags={"confluence", "read"},
-                parameters=["query"],
-                use_cases=["Find documentation", "Search wiki"],
-                examples=["Find docs about API"],
-                keywords={"search", "find", "documentation", "wiki"},
+                tags=frozenset({"confluence", "read"}),
+                parameters=("query",),
+                use_cases=("Find documentation", "Search wiki"),
+                examples=("Find docs about API",),
+                keywords=frozenset({"search", "find", "documentation", "wiki"}),
             ),
             "bitbucket_list_repositories": ToolIndexEntry(
                 name="bitbucket_list_repositories",
                 description="List repositories in a Bitbucket project.",
                 service="bitbucket",
                 is_write=False,
-                tags={"bitbucket", "read"},
-                parameters=["project_key"],
-                use_cases=["List repos", "See available repositories"],
-                examples=["What repos are in PROJ?"],
-                keywords={"repository", "repo", "list"},
+                tags=frozenset({"bitbucket", "read"}),
+                parameters=("project_key",),
+                use_cases=("List repos", "See available repositories"),
+                examples=("What repos are in PROJ?",),
+                keywords=frozenset({"repository", "repo", "list"}),
             ),
             "discover_tools": ToolIndexEntry(
                 name="discover_tools",
                 description="Find the most relevant tools for a task.",
                 service="meta",
                 is_write=False,
-                tags={"meta", "read"},
-                parameters=["task"],
-                use_cases=[],
-                examples=[],
-                keywords={"discover", "find", "tools"},
+                tags=frozenset({"meta", "read"}),
+                parameters=("task",),
+                use_cases=(),
+                examples=(),
+                keywords=frozenset({"discover", "find", "tools"}),
             ),
         }
         self.index._built = True
@@ -293,6 +337,17 @@ class TestToolDiscoveryIndexSearch:
         results = self.index.search("create ticket", include_write=False)
         assert all(not r.is_write for r in results)
 
+    def test_search_does_not_score_excluded_write_tools(self):
+        """Test that write tools are dropped before scoring when excluded."""
+        with patch(
+            "src.mcp_atlassian.servers.discovery.index.match_tool_relevance",
+            return_value=RelevanceMatch(0.5, set(), set(), set()),
+        ) as mock_score:
+            self.index.search("create ticket", include_write=False)
+
+        scored = {call.args[1].name for call in mock_score.call_args_list}
+        assert "jira_create_issue" not in scored
+
     def test_search_includes_write_tools_by_default(self):
         """Test that write tools are included by default."""
         results = self.index.search("create new ticket")
@@ -312,6 +367,112 @@ class TestToolDiscoveryIndexSearch:
         # May return empty or low-scoring results depending on implementation
         assert isinstance(results, list)
 
+    def test_search_scores_candidate_tools_first(self):
+        """Test that tools sharing a term with the query are scored first."""
+        with patch(
+            "src.mcp_atlassian.servers.discovery.index.match_tool_relevance",
+            return_value=RelevanceMatch(0.5, set(), set(), set()),
+        ) as mock_score:
+            self.index.search("repositories")
+
+        scored = [call.args[1].name for call in mock_score.call_args_list]
+        assert scored[0] == "bitbucket_list_repositories"
+        # Tools sharing no term are still scored while the top-k has room
+        assert set(scored) == self.index._tools.keys() - {"discover_tools"}
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "pages",
+            "repositories",
+            "sprints",
+            "boards",
+            "projects",
+            "comments",
+            "changes",
+            "repositries",
+            "get jira issue",
+            "find docs about the API",
+        ],
+    )
+    @pytest.mark.parametrize("limit", [1, 2, 7])
+    def test_search_matches_full_scan(self, query, limit):
+        """Test that candidate ordering and pruning match scoring every tool."""
+        prepared = prepare_query(query)
+        scored = []
+        for name, tool in self.index._tools.items():
+            if name == "discover_tools":
+                continue
+            score = match_tool_relevance(prepared, tool).score
+            if score > 0.1:
+                scored.append((score, name))
+        # sorted is stable, so ties keep index order like the search
+        expected = sorted(scored, key=lambda item: -item[0])[:limit]
+
+        results = self.index.search(query, limit=limit)
+
+        assert [(r.relevance_score, r.name) for r in results] == expected
+
+    def test_search_service_filter_scores_only_service_tools(self):
+        """Test that tools outside the filtered service are never scored."""
+        with patch(
+            "src.mcp_atlassian.servers.discovery.index.match_tool_relevance",
+            return_value=RelevanceMatch(0.5, set(), set(), set()),
+        ) as mock_score:
+            self.index.search("search", service_filter="Confluence")
+
+        scored = {call.args[1].name for call in mock_score.call_args_list}
+        assert scored == {"confluence_search"}
+
+    def test_search_pruning_keeps_top_results(self):
+        """Test that bound-based pruning does not change the top results."""
+        full = self.index.search("get jira issue", limit=10)
+        top = self.index.search("get jira issue", limit=1)
+        assert [r.name for r in top] == [r.name for r in full[:1]]
+
+    def test_truncated_query_tokens_expand_by_prefix(self):
+        """Test that a token expands to indexed terms it is a prefix of."""
+        assert self.index._get_candidates("repositor") == {
+            "bitbucket_list_repositories"
+        }
+        # Tokens shorter than the minimum prefix length only match exactly
+        assert self.index._get_candidates("re") is None
+
+    def test_misspelled_query_uses_trigram_candidates(self):
+        """Test that a query matching no term is scored against similar tools."""
+        assert self.index._get_candidates("repositries") == {
+            "bitbucket_list_repositories"
+        }
+        with patch(
+            "src.mcp_atlassian.servers.discovery.index.match_tool_relevance",
+            return_value=RelevanceMatch(0.5, set(), set(), set()),
+        ) as mock_score:
+            self.index.search("repositries")
+
+        scored = [call.args[1].name for call in mock_score.call_args_list]
+        assert scored[0] == "bitbucket_list_repositories"
+
+    def test_search_results_are_cached(self):
+        """Test that repeating a search reuses the cached ranking."""
+        with patch(
+            "src.mcp_atlassian.servers.discovery.index.match_tool_relevance",
+            return_value=RelevanceMatch(0.5, set(), set(), set()),
+        ) as mock_score:
+            first = self.index.search("list repositories")
+            calls_after_first = mock_score.call_count
+            second = self.index.search("  list repositories ")
+
+        assert calls_after_first > 0
+        assert mock_score.call_count == calls_after_first
+        assert first == second
+        assert first is not second
+
+    def test_search_cache_invalidated_when_tools_replaced(self):
+        """Test that replacing the tool map discards cached results."""
+        assert self.index.search("list repositories")
+        self.index._tools = {}
+        assert self.index.search("list repositories") == []
+
     def test_search_unbuilt_index_returns_empty(self):
         """Test that searching an unbuilt index returns empty."""
         ToolDiscoveryIndex.reset()
@@ -346,11 +507,11 @@ class TestToolDiscoveryIndexGetTool:
                 description="A test tool.",
                 service="jira",
                 is_write=False,
-                tags={"jira", "read"},
-                parameters=[],
-                use_cases=[],
-                examples=[],
-                keywords=set(),
+                tags=frozenset({"jira", "read"}),
+                parameters=(),
+                use_cases=(),
+                examples=(),
+                keywords=frozenset(),
             ),
         }
         self.index._built = True
@@ -410,3 +571,9 @@ class TestToolDiscoveryIndexKeywordExtraction:
         index = ToolDiscoveryIndex()
         keywords = index._extract_keywords_from_description("")
         assert keywords == set()
+
+    def test_extract_keywords_splits_on_non_ascii(self):
+        """Test that non-ASCII characters end words like other punctuation."""
+        index = ToolDiscoveryIndex()
+        keywords = index._extract_keywords_from_description("Update café—Page")
+        assert keywords == {"update", "caf", "page"}
@@ -3,12 +3,15 @@
 import pytest
 
 from src.mcp_atlassian.servers.discovery.scoring import (
+    _ACTION_REVERSE,
+    _ENTITY_REVERSE,
     ACTION_SYNONYMS,
     ENTITY_SYNONYMS,
     _extract_words,
-    _get_canonical_action,
-    _get_canonical_entity,
     _normalize_text,
+    build_tool_profile,
+    prepare_query,
+    relevance_upper_bound,
     score_tool_relevance,
 )
 from src.mcp_atlassian.servers.discovery.types import ToolIndexEntry
@@ -50,65 +53,68 @@ class TestExtractWords:
         result = _extract_words("issue-123 (details)")
         assert result == {"issue", "details"}
 
+    def test_uppercase_runs(self):
+        result = _extract_words("getHTTPServer useJQL")
+        assert result == {"get", "httpserver", "use", "jql"}
+
 
 class TestCanonicalAction:
     """Tests for action verb synonym matching."""
 
     def test_canonical_verb_returns_itself(self):
-        assert _get_canonical_action("get") == "get"
-        assert _get_canonical_action("create") == "create"
-        assert _get_canonical_action("update") == "update"
-        assert _get_canonical_action("delete") == "delete"
+        assert _ACTION_REVERSE.get("get") == "get"
+        assert _ACTION_REVERSE.get("create") == "create"
+        assert _ACTION_REVERSE.get("update") == "update"
+        assert _ACTION_REVERSE.get("delete") == "delete"
 
     def test_synonym_returns_canonical(self):
         # "fetch" is a synonym for "get"
-        assert _get_canonical_action("fetch") == "get"
-        assert _get_canonical_action("retrieve") == "get"
+        assert _ACTION_REVERSE.get("fetch") == "get"
+        assert _ACTION_REVERSE.get("retrieve") == "get"
 
         # "add" is a synonym for "create"
-        assert _get_canonical_action("add") == "create"
-        assert _get_canonical_action("new") == "create"
+        assert _ACTION_REVERSE.get("add") == "create"
+        assert _ACTION_REVERSE.get("new") == "create"
 
         # "edit" is a synonym for "update"
-        assert _get_canonical_action("edit") == "update"
-        assert _get_canonical_action("modify") == "update"
+        assert _ACTION_REVERSE.get("edit") == "update"
+        assert _ACTION_REVERSE.get("modify") == "update"
 
         # "remove" is a synonym for "delete"
-        assert _get_canonical_action("remove") == "delete"
+        assert _ACTION_REVERSE.get("remove") == "delete"
 
     def test_unknown_word_returns_none(self):
-        assert _get_canonical_action("banana") is None
-        assert _get_canonical_action("xyz123") is None
+        assert "banana" not in _ACTION_REVERSE
+        assert "xyz123" not in _ACTION_REVERSE
 
-    def test_case_insensitive(self):
-        assert _get_canonical_action("GET") == "get"
-        assert _get_canonical_action("Fetch") == "get"
+    def test_query_words_are_lowercased_before_lookup(self):
+        assert prepare_query("GET Fetch").actions == {"get"}
 
 
 class TestCanonicalEntity:
     """Tests for entity synonym matching."""
 
     def test_canonical_entity_returns_itself(self):
-        assert _get_canonical_entity("issue") == "issue"
-        assert _get_canonical_entity("page") == "page"
+        assert _ENTITY_REVERSE.get("issue") == "issue"
+        assert _ENTITY_REVERSE.get("page") == "page"
 
     def test_synonym_returns_canonical(self):
         # "ticket" and "bug" are synonyms for "issue"
-        assert _get_canonical_entity("ticket") == "issue"
-        assert _get_canonical_entity("bug") == "issue"
-        assert _get_canonical_entity("story") == "issue"
-        assert _get_canonical_entity("task") == "issue"
+        assert _ENTITY_REVERSE.get("ticket") == "issue"
+        assert _ENTITY_REVERSE.get("bug") == "issue"
+        assert _ENTITY_REVERSE.get("story") == "issue"
+        assert _ENTITY_REVERSE.get("task") == "issue"
 
         # "document" is a synonym for "page"
-        assert _get_canonical_entity("document") == "page"
-        assert _get_canonical_entity("doc") == "page"
+        assert _ENTITY_REVERSE.get("document") == "page"
+        assert _ENTITY_REVERSE.get("doc") == "page"
 
         # "pull request" synonyms
-        assert _get_canonical_entity("pr") == "pr"
+        assert _ENTITY_REVERSE.get("pr") == "pr"
 
     def test_unknown_entity_returns_none(self):
-        assert _get_canonical_entity("banana") is None
-        assert _get_canonical_entity("xyz123") is None
+        assert "banana" not in _ENTITY_REVERSE
+        assert "xyz123" not in _ENTITY_REVERSE
 
 
 class TestScoreToolRelevance:
@@ -251,9 +257,7 @@ class TestScoreToolRelevance:
     def test_use_case_matching(self, jira_get_issue_tool):
         """Test that use cases contribute to scoring."""
         # This closely matches a use case
-        score, reasons = score_tool_relevance(
-            "check issue status", jira_get_issue_tool
-        )
+        score, reasons = score_tool_relevance("check issue status", jira_get_issue_tool)
         assert score > 0.3
 
     def test_example_matching(self, jira_get_issue_tool):
@@ -310,6 +314,23 @@ class TestScoreToolRelevance:
         score, _ = score_tool_relevance("xyz abc 123", jira_get_issue_tool)
         assert score >= 0.0
 
+    def test_precomputed_profile_matches_default(self, jira_get_issue_tool):
+        """Test that passing a prebuilt profile gives the same result."""
+        profile = build_tool_profile(jira_get_issue_tool)
+        assert "jira" in profile.entities
+        for query in ["get issue details", "fetch the ticket", "xyz"]:
+            assert score_tool_relevance(
+                query, jira_get_issue_tool, profile=profile
+            ) == score_tool_relevance(query, jira_get_issue_tool)
+
+    def test_upper_bound_is_never_below_score(self, jira_get_issue_tool):
+        """Test that the pruning bound never underestimates the real score."""
+        profile = build_tool_profile(jira_get_issue_tool)
+        for query in ["get issue details", "fetch the ticket", "xyz", "jira"]:
+            score, _ = score_tool_relevance(query, jira_get_issue_tool)
+            bound = relevance_upper_bound(prepare_query(query), profile)
+            assert bound >= score
+
 
 class TestActionSynonymsCompleteness:
     """Tests to verify ACTION_SYNONYMS dictionary."""
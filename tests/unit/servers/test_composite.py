@@ -1,22 +1,37 @@
 """Unit tests for the Composite FastMCP server implementation."""
 
 import json
+import threading
+import time
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.mcp_atlassian.servers.composite import (
+    _build_development_links,
+    _build_issue_development_context,
+    _build_pr_jira_context,
+    _scan_repo_for_issue,
     get_issue_with_development_context,
     get_pr_with_jira_context,
     resolve_development_links,
 )
 
-# Access the underlying functions from the FunctionTool wrappers
+# Access the underlying functions from the FunctionTool wrappers. Most tests
+# assert on the _build_* dict builders directly; one test per tool still goes
+# through the JSON layer.
 _get_issue_with_development_context = get_issue_with_development_context.fn
 _get_pr_with_jira_context = get_pr_with_jira_context.fn
 _resolve_development_links = resolve_development_links.fn
 
 
+async def call_tool(tool, /, **kwargs):
+    """Await a composite tool function and decode its JSON response."""
+    return json.loads(await tool(**kwargs))
+
+
 # ============================================================================
 # Mock Data
 # ============================================================================
@@ -72,31 +87,62 @@ MOCK_BITBUCKET_PR = {
 # ============================================================================
 
 
+# Objects returned by fetcher calls are plain SimpleNamespace stubs, which
+# expose only what the composite tools use; each call builds a fresh one.
+
+
+def _mock_get_issue(issue_key, fields=None, expand=None, **kwargs):
+    response_data = {**MOCK_JIRA_ISSUE, "key": issue_key}
+    return SimpleNamespace(to_simplified_dict=lambda: response_data)
+
+
+def _mock_get_dev_info(issue_key, application_type=None):
+    response_data = dict(MOCK_DEVELOPMENT_INFO)
+    return SimpleNamespace(to_dict=lambda: response_data)
+
+
+def _mock_get_pr(project_key, repo_slug, pr_id):
+    response_data = {**MOCK_BITBUCKET_PR, "id": pr_id}
+    return SimpleNamespace(to_simplified_dict=lambda: response_data)
+
+
+def _mock_get_prs(project_key, repo_slug, state="OPEN", limit=50):
+    response_data = dict(MOCK_BITBUCKET_PR)
+    return [SimpleNamespace(to_simplified_dict=lambda: response_data)]
+
+
+def assert_contains(actual: dict, expected: dict) -> None:
+    """Assert that ``expected`` is a subtree of ``actual``.
+
+    Nested dicts are matched recursively; any other expected value must equal
+    the actual value and have the same type, so ``True`` does not match ``1``.
+    """
+    stack = [((), actual, expected)]
+    while stack:
+        path, act, exp = stack.pop()
+        if isinstance(exp, dict):
+            assert isinstance(act, dict), f"{'.'.join(path)}: expected a dict"
+            for key, value in exp.items():
+                assert key in act, f"missing key {'.'.join((*path, key))}"
+                stack.append(((*path, key), act[key], value))
+        else:
+            assert type(act) is type(exp) and act == exp, (
+                f"{'.'.join(path)}: {act!r} != {exp!r}"
+            )
+
+
 @pytest.fixture
 def mock_jira_fetcher():
     """Create a mock JiraFetcher."""
     mock_fetcher = MagicMock()
-    mock_fetcher.config = MagicMock()
-    mock_fetcher.config.url = "https://test.atlassian.net"
-    mock_fetcher.config.projects_filter = None
-
-    # Configure get_issue
-    def mock_get_issue(issue_key, fields=None, expand=None, **kwargs):
-        mock_issue = MagicMock()
-        response_data = MOCK_JIRA_ISSUE.copy()
-        response_data["key"] = issue_key
-        mock_issue.to_simplified_dict.return_value = response_data
-        return mock_issue
-
-    mock_fetcher.get_issue.side_effect = mock_get_issue
-
-    # Configure get_development_information
-    def mock_get_dev_info(issue_key, application_type=None):
-        mock_dev_info = MagicMock()
-        mock_dev_info.to_dict.return_value = MOCK_DEVELOPMENT_INFO.copy()
-        return mock_dev_info
+    mock_fetcher.config = SimpleNamespace(
+        url="https://test.atlassian.net", projects_filter=None
+    )
 
-    mock_fetcher.get_development_information.side_effect = mock_get_dev_info
+    # The hot fetcher methods are plain functions; tests override them by
+    # reassigning the attribute.
+    mock_fetcher.get_issue = _mock_get_issue
+    mock_fetcher.get_development_information = _mock_get_dev_info
 
     return mock_fetcher
 
@@ -105,31 +151,16 @@ def mock_jira_fetcher():
 def mock_bitbucket_fetcher():
     """Create a mock BitbucketFetcher."""
     mock_fetcher = MagicMock()
-    mock_fetcher.config = MagicMock()
-    mock_fetcher.config.url = "https://bitbucket.example.com"
+    mock_fetcher.config = SimpleNamespace(url="https://bitbucket.example.com")
 
-    # Configure get_pull_request
-    def mock_get_pr(project_key, repo_slug, pr_id):
-        mock_pr = MagicMock()
-        response_data = MOCK_BITBUCKET_PR.copy()
-        response_data["id"] = pr_id
-        mock_pr.to_simplified_dict.return_value = response_data
-        return mock_pr
-
-    mock_fetcher.get_pull_request.side_effect = mock_get_pr
+    # The hot fetcher methods are plain functions; tests override them by
+    # reassigning the attribute.
+    mock_fetcher.get_pull_request = _mock_get_pr
+    mock_fetcher.get_pull_requests = _mock_get_prs
+    mock_fetcher.get_pull_requests_iter = _mock_get_prs
 
     # Configure get_repositories
-    mock_repo = MagicMock()
-    mock_repo.slug = "my-repo"
-    mock_fetcher.get_repositories.return_value = [mock_repo]
-
-    # Configure get_pull_requests for search
-    def mock_get_prs(project_key, repo_slug, state="OPEN", limit=50):
-        mock_pr = MagicMock()
-        mock_pr.to_simplified_dict.return_value = MOCK_BITBUCKET_PR.copy()
-        return [mock_pr]
-
-    mock_fetcher.get_pull_requests.side_effect = mock_get_prs
+    mock_fetcher.get_repositories.return_value = [SimpleNamespace(slug="my-repo")]
 
     # Configure get_pull_request_changes
     mock_fetcher.get_pull_request_changes.return_value = {
@@ -141,6 +172,34 @@ def mock_bitbucket_fetcher():
     return mock_fetcher
 
 
+@pytest.fixture
+def patched_fetchers(mock_jira_fetcher, mock_bitbucket_fetcher):
+    """Patch both fetcher dependencies to return the mock fetchers.
+
+    Tests can reconfigure the yielded ``jira`` / ``bitbucket`` AsyncMocks,
+    e.g. set ``side_effect`` to simulate an unavailable service.
+    """
+    getters = SimpleNamespace(
+        jira=AsyncMock(return_value=mock_jira_fetcher),
+        bitbucket=AsyncMock(return_value=mock_bitbucket_fetcher),
+    )
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch(
+                "src.mcp_atlassian.servers.composite.get_jira_fetcher",
+                getters.jira,
+            )
+        )
+        stack.enter_context(
+            patch(
+                "src.mcp_atlassian.servers.composite.get_bitbucket_fetcher",
+                getters.bitbucket,
+            )
+        )
+        yield getters
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock FastMCP context."""
@@ -153,41 +212,31 @@ def mock_context():
 
 
 @pytest.mark.anyio
-async def test_get_issue_with_development_context(
-    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher
-):
+async def test_get_issue_with_development_context(mock_context, patched_fetchers):
     """Test getting a Jira issue with development context."""
-    with (
-        patch(
-            "src.src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-        patch(
-            "src.mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-    ):
-        response = await _get_issue_with_development_context(
-            ctx=mock_context,
-            issue_key="PROJ-123",
-            include_pr_details=True,
-            include_pr_diff_summary=False,
-        )
+    content = await call_tool(
+        _get_issue_with_development_context,
+        ctx=mock_context,
+        issue_key="PROJ-123",
+        include_pr_details=True,
+        include_pr_diff_summary=False,
+    )
 
-    content = json.loads(response)
-    assert content["issue_key"] == "PROJ-123"
-    assert content["issue"] is not None
-    assert content["issue"]["key"] == "PROJ-123"
-    assert content["development_info"] is not None
-    assert content["development_info"]["has_development_info"] is True
+    assert_contains(
+        content,
+        {
+            "issue_key": "PROJ-123",
+            "issue": {"key": "PROJ-123"},
+            "development_info": {"has_development_info": True},
+            "summary": {"issue_found": True, "has_development_info": True},
+        },
+    )
     assert len(content["pull_requests"]) > 0
-    assert content["summary"]["issue_found"] is True
-    assert content["summary"]["has_development_info"] is True
 
 
 @pytest.mark.anyio
 async def test_get_issue_with_development_context_no_dev_info(
-    mock_context, mock_jira_fetcher
+    mock_context, mock_jira_fetcher, patched_fetchers
 ):
     """Test when development info is not available."""
 
@@ -203,57 +252,71 @@ async def test_get_issue_with_development_context_no_dev_info(
         }
         return mock_dev_info
 
-    mock_jira_fetcher.get_development_information.side_effect = mock_no_dev_info
+    mock_jira_fetcher.get_development_information = mock_no_dev_info
 
-    with patch(
-        "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-        AsyncMock(return_value=mock_jira_fetcher),
-    ):
-        response = await _get_issue_with_development_context(
-            ctx=mock_context,
-            issue_key="PROJ-999",
-        )
+    content = await _build_issue_development_context(
+        ctx=mock_context,
+        issue_key="PROJ-999",
+    )
 
-    content = json.loads(response)
     assert content["summary"]["has_development_info"] is False
     assert len(content["pull_requests"]) == 0
 
 
 @pytest.mark.anyio
-async def test_get_issue_with_development_context_jira_error(mock_context):
-    """Test error handling when Jira is unavailable."""
-    with patch(
-        "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-        AsyncMock(side_effect=ValueError("Jira not configured")),
-    ):
-        response = await _get_issue_with_development_context(
-            ctx=mock_context,
-            issue_key="PROJ-123",
-        )
+async def test_get_issue_jira_error_during_fetch(
+    mock_context, mock_jira_fetcher, patched_fetchers
+):
+    """Test error handling when Jira issue fetch fails."""
+    mock_jira_fetcher.get_issue = MagicMock(side_effect=Exception("Issue not found"))
+
+    content = await _build_issue_development_context(
+        ctx=mock_context,
+        issue_key="NONEXISTENT-999",
+    )
 
-    content = json.loads(response)
+    assert content["issue"] is None
     assert len(content["errors"]) > 0
-    assert "Jira not available" in content["errors"][0]
+    assert "Failed to fetch issue" in content["errors"][0]
 
 
 @pytest.mark.anyio
-async def test_get_issue_jira_error_during_fetch(mock_context, mock_jira_fetcher):
-    """Test error handling when Jira issue fetch fails."""
-    mock_jira_fetcher.get_issue.side_effect = Exception("Issue not found")
+async def test_resolve_fetches_each_issue_once_per_tree(
+    mock_context, mock_jira_fetcher, patched_fetchers
+):
+    """Test that a depth-2 resolve fetches each linked issue only once."""
+    mock_jira_fetcher.get_issue = MagicMock(side_effect=_mock_get_issue)
+
+    content = await _build_development_links(
+        ctx=mock_context,
+        identifier="PROJ/my-repo#456",
+        resolve_depth=2,
+    )
+
+    linked = content["data"]["linked_jira_issues"]
+    assert linked
+    assert all("development_context" in issue for issue in linked)
+    fetched = [
+        c.kwargs["issue_key"] for c in mock_jira_fetcher.get_issue.call_args_list
+    ]
+    assert sorted(fetched) == sorted({issue["key"] for issue in linked})
+
+
+@pytest.mark.anyio
+async def test_get_issue_does_not_reuse_issue_across_calls(
+    mock_context, mock_jira_fetcher, patched_fetchers
+):
+    """Test that separate tool calls fetch the issue again."""
+    mock_jira_fetcher.get_issue = MagicMock(side_effect=_mock_get_issue)
 
-    with patch(
-        "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-        AsyncMock(return_value=mock_jira_fetcher),
-    ):
-        response = await _get_issue_with_development_context(
+    for _ in range(2):
+        content = await _build_issue_development_context(
             ctx=mock_context,
-            issue_key="NONEXISTENT-999",
+            issue_key="PROJ-321",
         )
+        assert content["issue"]["key"] == "PROJ-321"
 
-    content = json.loads(response)
-    assert content["issue"] is None
-    assert len(content["errors"]) > 0
-    assert "Failed to fetch issue" in content["errors"][0]
+    assert mock_jira_fetcher.get_issue.call_count == 2
 
 
 # ============================================================================
@@ -262,122 +325,64 @@ async def test_get_issue_jira_error_during_fetch(mock_context, mock_jira_fetcher
 
 
 @pytest.mark.anyio
-async def test_get_pr_with_jira_context(
-    mock_context, mock_bitbucket_fetcher, mock_jira_fetcher
-):
+async def test_get_pr_with_jira_context(mock_context, patched_fetchers):
     """Test getting a Bitbucket PR with Jira context."""
-    with (
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-    ):
-        response = await _get_pr_with_jira_context(
-            ctx=mock_context,
-            project_key="PROJ",
-            repository_slug="my-repo",
-            pull_request_id=456,
-            resolve_jira_issues=True,
-        )
+    content = await call_tool(
+        _get_pr_with_jira_context,
+        ctx=mock_context,
+        project_key="PROJ",
+        repository_slug="my-repo",
+        pull_request_id=456,
+        resolve_jira_issues=True,
+    )
 
-    content = json.loads(response)
-    assert content["pull_request"] is not None
-    assert content["pull_request"]["id"] == 456
+    assert_contains(
+        content, {"pull_request": {"id": 456}, "summary": {"pr_found": True}}
+    )
     # Should have found PROJ-123 and PROJ-456 from title/description
     assert len(content["jira_key_matches"]) >= 1
-    assert content["summary"]["pr_found"] is True
     assert content["summary"]["jira_keys_found"] >= 1
 
 
 @pytest.mark.anyio
-async def test_get_pr_with_jira_context_no_resolve(
-    mock_context, mock_bitbucket_fetcher, mock_jira_fetcher
-):
+async def test_get_pr_with_jira_context_no_resolve(mock_context, patched_fetchers):
     """Test getting a PR without resolving Jira issues."""
-    with (
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-    ):
-        response = await _get_pr_with_jira_context(
-            ctx=mock_context,
-            project_key="PROJ",
-            repository_slug="my-repo",
-            pull_request_id=456,
-            resolve_jira_issues=False,
-        )
+    content = await _build_pr_jira_context(
+        ctx=mock_context,
+        project_key="PROJ",
+        repository_slug="my-repo",
+        pull_request_id=456,
+        resolve_jira_issues=False,
+    )
 
-    content = json.loads(response)
     assert content["pull_request"] is not None
     assert len(content["jira_key_matches"]) >= 1
     # Should not have resolved issues
     assert len(content["linked_jira_issues"]) == 0
 
 
-@pytest.mark.anyio
-async def test_get_pr_with_jira_context_bitbucket_error(mock_context):
-    """Test error handling when Bitbucket is unavailable."""
-    with patch(
-        "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-        AsyncMock(side_effect=ValueError("Bitbucket not configured")),
-    ):
-        response = await _get_pr_with_jira_context(
-            ctx=mock_context,
-            project_key="PROJ",
-            repository_slug="my-repo",
-            pull_request_id=456,
-        )
-
-    content = json.loads(response)
-    assert len(content["errors"]) > 0
-    assert "Bitbucket not available" in content["errors"][0]
-
-
 @pytest.mark.anyio
 async def test_get_pr_jira_issue_fetch_error(
-    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher
+    mock_context, mock_jira_fetcher, patched_fetchers
 ):
     """Test partial resolution when some Jira issues fail to fetch."""
 
     def mock_get_issue_with_error(issue_key, fields=None, expand=None, **kwargs):
         if issue_key == "PROJ-456":
             raise Exception("Issue not found")
-        mock_issue = MagicMock()
-        response_data = MOCK_JIRA_ISSUE.copy()
-        response_data["key"] = issue_key
-        mock_issue.to_simplified_dict.return_value = response_data
-        return mock_issue
-
-    mock_jira_fetcher.get_issue.side_effect = mock_get_issue_with_error
-
-    with (
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-    ):
-        response = await _get_pr_with_jira_context(
-            ctx=mock_context,
-            project_key="PROJ",
-            repository_slug="my-repo",
-            pull_request_id=456,
-            resolve_jira_issues=True,
-        )
+        response_data = {**MOCK_JIRA_ISSUE, "key": issue_key}
+        return SimpleNamespace(to_simplified_dict=lambda: response_data)
+
+    mock_jira_fetcher.get_issue = mock_get_issue_with_error
+
+    content = await _build_pr_jira_context(
+        ctx=mock_context,
+        project_key="PROJ",
+        repository_slug="my-repo",
+        pull_request_id=456,
+        resolve_jira_issues=True,
+    )
 
-    content = json.loads(response)
     # Should still have PR info
     assert content["pull_request"] is not None
     # Should have partial resolution - some succeed, some fail
@@ -389,138 +394,109 @@ async def test_get_pr_jira_issue_fetch_error(
     assert len(errors_found) + len(successes_found) >= 1
 
 
-# ============================================================================
-# Tests for resolve_development_links
-# ============================================================================
-
-
 @pytest.mark.anyio
-async def test_resolve_development_links_jira_issue(
-    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher
+async def test_get_pr_resolves_linked_issues_in_order(
+    mock_context, mock_jira_fetcher, patched_fetchers
 ):
-    """Test resolving a Jira issue identifier."""
-    with (
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-    ):
-        response = await _resolve_development_links(
-            ctx=mock_context,
-            identifier="PROJ-123",
-            resolve_depth=1,
-        )
-
-    content = json.loads(response)
-    assert content["identifier"] == "PROJ-123"
-    assert content["resolved_type"] == "jira"
-    assert content["data"] is not None
-    assert content["data"]["issue_key"] == "PROJ-123"
+    """Test concurrent Jira resolution keeps match order and isolates errors."""
 
+    def mock_get_issue_with_error(issue_key, fields=None, expand=None, **kwargs):
+        if issue_key == "PROJ-456":
+            raise Exception("Issue not found")
+        response_data = {**MOCK_JIRA_ISSUE, "key": issue_key}
+        return SimpleNamespace(to_simplified_dict=lambda: response_data)
 
-@pytest.mark.anyio
-async def test_resolve_development_links_bitbucket_pr(
-    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher
-):
-    """Test resolving a Bitbucket PR identifier."""
-    with (
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-    ):
-        response = await _resolve_development_links(
-            ctx=mock_context,
-            identifier="PROJ/my-repo#456",
-            resolve_depth=1,
-        )
+    mock_jira_fetcher.get_issue = mock_get_issue_with_error
 
-    content = json.loads(response)
-    assert content["identifier"] == "PROJ/my-repo#456"
-    assert content["resolved_type"] == "bitbucket"
-    assert content["data"] is not None
-    assert content["data"]["pull_request"]["id"] == 456
+    content = await _build_pr_jira_context(
+        ctx=mock_context,
+        project_key="PROJ",
+        repository_slug="my-repo",
+        pull_request_id=456,
+        resolve_jira_issues=True,
+    )
 
+    linked = content["linked_jira_issues"]
+    assert [i["key"] for i in linked] == ["PROJ-123", "PROJ-456"]
+    assert linked[0]["issue"]["key"] == "PROJ-123"
+    assert linked[1]["error"] == "Issue not found"
+    assert content["summary"]["jira_issues_resolved"] == 1
 
-@pytest.mark.anyio
-async def test_resolve_development_links_bitbucket_repo(
-    mock_context, mock_bitbucket_fetcher
-):
-    """Test resolving a Bitbucket repo identifier (without PR)."""
-    with patch(
-        "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-        AsyncMock(return_value=mock_bitbucket_fetcher),
-    ):
-        response = await _resolve_development_links(
-            ctx=mock_context,
-            identifier="PROJ/my-repo",
-            resolve_depth=1,
-        )
 
-    content = json.loads(response)
-    assert content["resolved_type"] == "bitbucket"
-    assert content["data"] is not None
-    assert "open_pull_requests" in content["data"]
+# ============================================================================
+# Tests for resolve_development_links
+# ============================================================================
 
 
 @pytest.mark.anyio
-async def test_resolve_development_links_invalid_identifier(mock_context):
-    """Test error handling for invalid identifier."""
-    response = await _resolve_development_links(
+@pytest.mark.parametrize(
+    ("identifier", "expected", "error"),
+    [
+        pytest.param(
+            "PROJ-123",
+            {"resolved_type": "jira", "data": {"issue_key": "PROJ-123"}},
+            None,
+            id="jira_issue",
+        ),
+        pytest.param(
+            "PROJ/my-repo#456",
+            {"resolved_type": "bitbucket", "data": {"pull_request": {"id": 456}}},
+            None,
+            id="bitbucket_pr",
+        ),
+        pytest.param(
+            "PROJ/my-repo",
+            {
+                "resolved_type": "bitbucket",
+                "data": {
+                    "repository_slug": "my-repo",
+                    "open_pull_requests": [MOCK_BITBUCKET_PR],
+                },
+            },
+            None,
+            id="bitbucket_repo",
+        ),
+        pytest.param(
+            "invalid-identifier",
+            {"resolved_type": None},
+            "Unrecognized identifier format",
+            id="invalid_identifier",
+        ),
+        pytest.param(
+            "",
+            {"resolved_type": None},
+            "cannot be empty",
+            id="empty_identifier",
+        ),
+    ],
+)
+async def test_resolve_development_links(
+    mock_context, patched_fetchers, identifier, expected, error
+):
+    """Test resolving each identifier form at depth 1."""
+    content = await call_tool(
+        _resolve_development_links,
         ctx=mock_context,
-        identifier="invalid-identifier",
+        identifier=identifier,
         resolve_depth=1,
     )
 
-    content = json.loads(response)
-    assert len(content["errors"]) > 0
-    assert "Unrecognized identifier format" in content["errors"][0]
+    assert_contains(content, {"identifier": identifier, **expected})
+    if error is None:
+        assert content["errors"] == []
+    else:
+        assert error in content["errors"][0]
 
 
 @pytest.mark.anyio
-async def test_resolve_development_links_empty_identifier(mock_context):
-    """Test error handling for empty identifier."""
-    response = await _resolve_development_links(
+async def test_resolve_with_depth_2(mock_context, patched_fetchers):
+    """Test resolve_development_links with depth 2."""
+    content = await _build_development_links(
         ctx=mock_context,
-        identifier="",
-        resolve_depth=1,
+        identifier="PROJ/my-repo#456",
+        resolve_depth=2,
     )
 
-    content = json.loads(response)
-    assert len(content["errors"]) > 0
-    assert "cannot be empty" in content["errors"][0]
-
-
-@pytest.mark.anyio
-async def test_resolve_with_depth_2(
-    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher
-):
-    """Test resolve_development_links with depth 2."""
-    with (
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-    ):
-        response = await _resolve_development_links(
-            ctx=mock_context,
-            identifier="PROJ/my-repo#456",
-            resolve_depth=2,
-        )
-
-    content = json.loads(response)
     assert content["resolved_type"] == "bitbucket"
     assert content["data"] is not None
     # With depth 2, linked issues should have development_context
@@ -530,7 +506,8 @@ async def test_resolve_with_depth_2(
         for issue in linked:
             if "issue" in issue:
                 assert (
-                    "development_context" in issue or "development_context_error" in issue
+                    "development_context" in issue
+                    or "development_context_error" in issue
                 )
 
 
@@ -540,105 +517,212 @@ async def test_resolve_with_depth_2(
 
 
 @pytest.mark.anyio
-async def test_get_issue_with_pr_diff_summary(
-    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher
-):
-    """Test including PR diff summaries."""
-    with (
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-    ):
-        response = await _get_issue_with_development_context(
-            ctx=mock_context,
-            issue_key="PROJ-123",
-            include_pr_details=True,
-            include_pr_diff_summary=True,
-        )
+@pytest.mark.parametrize(
+    "extra",
+    [
+        {"include_pr_diff_summary": True},
+        {"bitbucket_project_key": "PROJ"},
+        {},
+    ],
+    ids=["diff_summary", "bb_filter", "baseline"],
+)
+async def test_get_issue_option_matrix(mock_context, patched_fetchers, extra):
+    """Test that optional flags do not change the core issue response."""
+    content = await _build_issue_development_context(
+        ctx=mock_context,
+        issue_key="PROJ-123",
+        include_pr_details=True,
+        **extra,
+    )
 
-    content = json.loads(response)
-    assert content["issue_key"] == "PROJ-123"
-    # When diff summary is requested, PRs should have diff info (if Bitbucket available)
-    if content["pull_requests"]:
-        # The implementation should attempt to add diff info
-        pass  # PR diff info depends on Bitbucket fetcher availability
+    assert_contains(
+        content, {"issue_key": "PROJ-123", "summary": {"issue_found": True}}
+    )
 
 
 @pytest.mark.anyio
-async def test_get_issue_with_bitbucket_project_filter(
-    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher
+async def test_get_issue_scans_bitbucket_repos_concurrently(
+    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher, patched_fetchers
 ):
-    """Test filtering PRs by Bitbucket project."""
-    with (
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(return_value=mock_jira_fetcher),
-        ),
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-    ):
-        response = await _get_issue_with_development_context(
-            ctx=mock_context,
-            issue_key="PROJ-123",
-            include_pr_details=True,
-            bitbucket_project_key="PROJ",
-        )
+    """Test the Bitbucket fallback scans every repository and merges PRs."""
+
+    def mock_no_dev_info(issue_key, application_type=None):
+        mock_dev_info = MagicMock()
+        mock_dev_info.to_dict.return_value = {"has_development_info": False}
+        return mock_dev_info
+
+    mock_jira_fetcher.get_development_information = mock_no_dev_info
+
+    repo_a, repo_b, repo_broken = MagicMock(), MagicMock(), MagicMock()
+    repo_a.slug, repo_b.slug, repo_broken.slug = "repo-a", "repo-b", "broken"
+    mock_bitbucket_fetcher.get_repositories.return_value = [
+        repo_a,
+        repo_b,
+        repo_broken,
+    ]
+
+    def mock_get_prs(project_key, repo_slug, state="OPEN", limit=50):
+        if repo_slug == "broken":
+            raise Exception("Repository unavailable")
+        mock_pr = MagicMock()
+        mock_pr.to_simplified_dict.return_value = MOCK_BITBUCKET_PR.copy()
+        return [mock_pr]
+
+    mock_bitbucket_fetcher.get_pull_requests_iter = mock_get_prs
 
-    content = json.loads(response)
-    assert content["issue_key"] == "PROJ-123"
-    assert content["summary"]["issue_found"] is True
+    content = await _build_issue_development_context(
+        ctx=mock_context,
+        issue_key="PROJ-123",
+        include_pr_details=True,
+        include_pr_diff_summary=False,
+        bitbucket_project_key="PROJ",
+    )
+
+    assert [pr["repository_slug"] for pr in content["pull_requests"]] == [
+        "repo-a",
+        "repo-b",
+    ]
+    assert content["summary"]["pr_count"] == 2
 
 
 @pytest.mark.anyio
-async def test_resolve_development_links_jira_service_unavailable(
-    mock_context, mock_bitbucket_fetcher
+async def test_get_issue_bitbucket_scan_stops_at_max_prs(
+    mock_context, mock_jira_fetcher, mock_bitbucket_fetcher, patched_fetchers
 ):
-    """Test resolve when Jira service is unavailable but identifier is Jira."""
-    with (
-        patch(
-            "src.mcp_atlassian.servers.composite.get_jira_fetcher",
-            AsyncMock(side_effect=ValueError("Jira not configured")),
-        ),
-        patch(
-            "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-            AsyncMock(return_value=mock_bitbucket_fetcher),
-        ),
-    ):
-        response = await _resolve_development_links(
-            ctx=mock_context,
-            identifier="PROJ-123",
-            resolve_depth=1,
-        )
+    """Test that max_prs keeps the first PRs in repo order, however scans finish."""
 
-    content = json.loads(response)
-    assert content["resolved_type"] == "jira"
-    # Should have error about Jira being unavailable (propagated from inner call)
-    assert content["data"] is not None
-    assert len(content["data"]["errors"]) > 0
+    def mock_no_dev_info(issue_key, application_type=None):
+        mock_dev_info = MagicMock()
+        mock_dev_info.to_dict.return_value = {"has_development_info": False}
+        return mock_dev_info
+
+    mock_jira_fetcher.get_development_information = mock_no_dev_info
+
+    repos = [MagicMock(slug=f"repo-{i}") for i in range(3)]
+    mock_bitbucket_fetcher.get_repositories.return_value = repos
+    listed = {f"repo-{i}": threading.Event() for i in (1, 2)}
+
+    def mock_get_prs(project_key, repo_slug, state="OPEN", limit=50):
+        if repo_slug == "repo-0":
+            # Let the later repos finish their scans first
+            for event in listed.values():
+                event.wait(timeout=1)
+            time.sleep(0.05)
+        for i in range(2):
+            mock_pr = MagicMock()
+            mock_pr.to_simplified_dict.return_value = {
+                **MOCK_BITBUCKET_PR,
+                "id": f"{repo_slug}#{i}",
+            }
+            yield mock_pr
+        if repo_slug in listed:
+            listed[repo_slug].set()
+
+    mock_bitbucket_fetcher.get_pull_requests_iter = mock_get_prs
+
+    content = await _build_issue_development_context(
+        ctx=mock_context,
+        issue_key="PROJ-123",
+        bitbucket_project_key="PROJ",
+        max_prs=3,
+    )
+
+    assert [pr["id"] for pr in content["pull_requests"]] == [
+        "repo-0#0",
+        "repo-0#1",
+        "repo-1#0",
+    ]
+
+
+def test_scan_repo_for_issue_honours_stop_event(mock_bitbucket_fetcher):
+    """Test a repo scan stops paginating once the stop event is set."""
+    stop_event = threading.Event()
+    fetched = []
+
+    def mock_get_prs(project_key, repo_slug, state="OPEN", limit=50):
+        for i in range(5):
+            fetched.append(i)
+            if i == 1:
+                stop_event.set()
+            mock_pr = MagicMock()
+            mock_pr.to_simplified_dict.return_value = MOCK_BITBUCKET_PR.copy()
+            yield mock_pr
+
+    mock_bitbucket_fetcher.get_pull_requests_iter = mock_get_prs
+
+    pr_infos = _scan_repo_for_issue(
+        mock_bitbucket_fetcher,
+        "PROJ",
+        "repo-a",
+        "PROJ-123",
+        include_pr_diff_summary=False,
+        stop_event=stop_event,
+    )
+
+    assert len(pr_infos) == 1
+    assert fetched == [0, 1]
+
+
+# ============================================================================
+# Tests for unavailable services
+# ============================================================================
 
 
 @pytest.mark.anyio
-async def test_resolve_development_links_bitbucket_service_unavailable(mock_context):
-    """Test resolve when Bitbucket service is unavailable but identifier is Bitbucket."""
-    with patch(
-        "mcp_atlassian.servers.composite.get_bitbucket_fetcher",
-        AsyncMock(side_effect=ValueError("Bitbucket not configured")),
-    ):
-        response = await _resolve_development_links(
-            ctx=mock_context,
-            identifier="PROJ/my-repo#456",
-            resolve_depth=1,
-        )
+@pytest.mark.parametrize(
+    ("fetcher", "service", "tool", "kwargs", "resolved_type"),
+    [
+        pytest.param(
+            "jira",
+            "Jira",
+            _build_issue_development_context,
+            {"issue_key": "PROJ-123"},
+            None,
+            id="issue_context_jira_unavailable",
+        ),
+        pytest.param(
+            "bitbucket",
+            "Bitbucket",
+            _build_pr_jira_context,
+            {
+                "project_key": "PROJ",
+                "repository_slug": "my-repo",
+                "pull_request_id": 456,
+            },
+            None,
+            id="pr_context_bitbucket_unavailable",
+        ),
+        pytest.param(
+            "jira",
+            "Jira",
+            _build_development_links,
+            {"identifier": "PROJ-123", "resolve_depth": 1},
+            "jira",
+            id="resolve_jira_unavailable",
+        ),
+        pytest.param(
+            "bitbucket",
+            "Bitbucket",
+            _build_development_links,
+            {"identifier": "PROJ/my-repo#456", "resolve_depth": 1},
+            "bitbucket",
+            id="resolve_bitbucket_unavailable",
+        ),
+    ],
+)
+async def test_service_unavailable(
+    mock_context, patched_fetchers, fetcher, service, tool, kwargs, resolved_type
+):
+    """Test that an unconfigured service is reported in the errors list."""
+    getattr(patched_fetchers, fetcher).side_effect = ValueError(
+        f"{service} not configured"
+    )
 
-    content = json.loads(response)
-    assert content["resolved_type"] == "bitbucket"
-    # Should have error about Bitbucket being unavailable (propagated from inner call)
-    assert content["data"] is not None
-    assert len(content["data"]["errors"]) > 0
+    content = await tool(ctx=mock_context, **kwargs)
+
+    if resolved_type is not None:
+        # resolve_development_links nests the inner call's result under "data"
+        assert content["resolved_type"] == resolved_type
+        content = content["data"]
+    assert content is not None
+    assert f"{service} not available" in content["errors"][0]
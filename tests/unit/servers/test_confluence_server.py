@@ -21,6 +21,12 @@ from src.mcp_atlassian.utils.oauth import OAuthConfig
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture
+def anyio_backend():
+    """Pin these tests to asyncio; fastmcp's Client starts its session task with asyncio."""
+    return "asyncio"
+
+
 @pytest.fixture
 def mock_confluence_fetcher():
     """Create a mocked ConfluenceFetcher instance for testing."""
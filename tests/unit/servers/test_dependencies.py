@@ -6,11 +6,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mcp_atlassian.bitbucket import BitbucketConfig
 from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
 from mcp_atlassian.jira import JiraConfig, JiraFetcher
+from mcp_atlassian.servers import dependencies
 from mcp_atlassian.servers.context import MainAppContext
 from mcp_atlassian.servers.dependencies import (
     _create_user_config_for_fetcher,
+    get_bitbucket_fetcher,
     get_confluence_fetcher,
     get_jira_fetcher,
 )
@@ -814,3 +817,62 @@ class TestGetConfluenceFetcher:
 
         with pytest.raises(ValueError, match=expected_error_match):
             await get_confluence_fetcher(mock_context)
+
+
+class TestGetBitbucketFetcher:
+    """Tests for get_bitbucket_fetcher outside an HTTP request."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_global_fetcher(self):
+        """Isolate the module-level fetcher cache between tests."""
+        dependencies._global_bitbucket_fetcher = None
+        yield
+        dependencies._global_bitbucket_fetcher = None
+
+    @staticmethod
+    def _bitbucket_config() -> BitbucketConfig:
+        return BitbucketConfig(
+            url="https://bitbucket.example.com",
+            auth_type="pat",
+            personal_token="test-token",
+        )
+
+    @patch("mcp_atlassian.servers.dependencies.BitbucketFetcher")
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    async def test_global_fetcher_reused(
+        self, mock_get_http_request, mock_fetcher_class, mock_context
+    ):
+        """Test the global fetcher is built once per config object."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        config = self._bitbucket_config()
+        _setup_mock_context(mock_context, MainAppContext(full_bitbucket_config=config))
+
+        first = await get_bitbucket_fetcher(mock_context)
+        second = await get_bitbucket_fetcher(mock_context)
+
+        assert first is second
+        mock_fetcher_class.assert_called_once_with(config=config)
+
+    @patch("mcp_atlassian.servers.dependencies.BitbucketFetcher")
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    async def test_global_fetcher_rebuilt_for_new_config(
+        self, mock_get_http_request, mock_fetcher_class, mock_context
+    ):
+        """Test a replaced config object invalidates the cached fetcher."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        mock_fetcher_class.side_effect = lambda config: MagicMock(config=config)
+        old_config = self._bitbucket_config()
+        new_config = self._bitbucket_config()
+
+        _setup_mock_context(
+            mock_context, MainAppContext(full_bitbucket_config=old_config)
+        )
+        first = await get_bitbucket_fetcher(mock_context)
+        _setup_mock_context(
+            mock_context, MainAppContext(full_bitbucket_config=new_config)
+        )
+        second = await get_bitbucket_fetcher(mock_context)
+
+        assert first is not second
+        assert second.config is new_config
+        assert mock_fetcher_class.call_count == 2
@@ -26,6 +26,12 @@ from tests.fixtures.jira_mocks import (
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture
+def anyio_backend():
+    """Pin these tests to asyncio; fastmcp's Client starts its session task with asyncio."""
+    return "asyncio"
+
+
 @pytest.fixture
 def mock_jira_fetcher():
     """Create a mock JiraFetcher using predefined responses from fixtures."""
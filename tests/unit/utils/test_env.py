@@ -1,6 +1,7 @@
 """Tests for environment variable utility functions."""
 
 from mcp_atlassian.utils.env import (
+    get_env_positive_int,
     is_env_extended_truthy,
     is_env_ssl_verify,
     is_env_truthy,
@@ -215,3 +216,28 @@ class TestEdgeCases:
                 assert is_env_truthy("TEST_VAR") is False
                 assert is_env_extended_truthy("TEST_VAR") is False
             assert is_env_ssl_verify("TEST_VAR") is True  # Not in false values
+
+
+class TestGetEnvPositiveInt:
+    """Test the get_env_positive_int function."""
+
+    def test_unset_and_empty_use_default(self, monkeypatch):
+        """Test unset and blank variables fall back to the default."""
+        monkeypatch.delenv("TEST_VAR", raising=False)
+        assert get_env_positive_int("TEST_VAR", 32) == 32
+
+        monkeypatch.setenv("TEST_VAR", "  ")
+        assert get_env_positive_int("TEST_VAR", 32) == 32
+
+    def test_valid_value(self, monkeypatch):
+        """Test a positive integer is returned as-is."""
+        monkeypatch.setenv("TEST_VAR", "8")
+        assert get_env_positive_int("TEST_VAR", 32) == 8
+
+    def test_invalid_values_use_default(self, monkeypatch, caplog):
+        """Test malformed and non-positive values warn and use the default."""
+        for value in ["abc", "1.5", "0", "-4"]:
+            monkeypatch.setenv("TEST_VAR", value)
+            caplog.clear()
+            assert get_env_positive_int("TEST_VAR", 32) == 32
+            assert "TEST_VAR" in caplog.text
@@ -146,6 +146,13 @@ class TestExtractJiraKeys:
         assert len(matches) == 1
         assert matches[0].key == "PROJ-123"
 
+    def test_keys_do_not_span_fields(self):
+        """Test that adjacent fields are not joined into a single key."""
+        matches = extract_jira_keys(
+            title="Bump PROJ", branch_name="-123", description="456 PROJ-7"
+        )
+        assert [(m.key, m.source) for m in matches] == [("PROJ-7", "description")]
+
 
 class TestParseDevelopmentIdentifier:
     """Tests for the parse_development_identifier function."""
@@ -302,3 +309,10 @@ class TestDevelopmentIdentifierDataclass:
         assert ident.repo_slug == "my-repo"
         assert ident.pr_id == 456
         assert ident.issue_key is None
+
+    def test_parsed_identifier_is_cached_and_frozen(self):
+        """Test that repeated parses share one immutable result."""
+        first = parse_development_identifier("PROJ/my-repo#456")
+        assert parse_development_identifier("PROJ/my-repo#456") is first
+        with pytest.raises(AttributeError):
+            first.pr_id = 1
@@ -1,6 +1,9 @@
 """Tests for the rate limiting utilities module."""
 
+import asyncio
+import threading
 import time
+from dataclasses import FrozenInstanceError
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,6 +13,7 @@ from mcp_atlassian.utils.rate_limit import (
     RateLimitConfig,
     RateLimitedAdapter,
     RateLimiterRegistry,
+    SlidingWindowLimiter,
     TokenBucket,
     configure_rate_limiting,
     get_config_from_env,
@@ -41,6 +45,11 @@ class TestRateLimitConfig:
         assert config.backoff_base == 2.0
         assert config.max_retries == 3
 
+    def test_config_is_frozen(self):
+        """Test that configs are immutable, so DEFAULT can be shared."""
+        with pytest.raises(FrozenInstanceError):
+            RateLimitConfig.DEFAULT.burst_capacity = 1
+
 
 class TestGetConfigFromEnv:
     """Test the get_config_from_env function."""
@@ -61,6 +70,8 @@ class TestGetConfigFromEnv:
         assert config.burst_capacity == 20
         assert config.backoff_base == 1.0
         assert config.max_retries == 5
+        # Defaults are served from the shared frozen instance
+        assert config is RateLimitConfig.DEFAULT
 
     def test_global_env_vars(self, monkeypatch):
         """Test that global environment variables are read correctly."""
@@ -100,6 +111,39 @@ class TestGetConfigFromEnv:
             # Should have logged warnings
             assert mock_logger.warning.call_count >= 2
 
+    @pytest.mark.parametrize(
+        ("rps", "burst"), [("0", "0"), ("-1.5", "-3"), ("nan", "0")]
+    )
+    def test_out_of_range_env_values_use_default(self, monkeypatch, rps, burst):
+        """Test that a non-positive rate or an empty burst falls back."""
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_RPS", "5")
+        monkeypatch.setenv("JIRA_RATE_LIMIT_RPS", rps)
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_BURST", burst)
+
+        with patch("mcp_atlassian.utils.rate_limit.logger") as mock_logger:
+            config = get_config_from_env("jira")
+            assert config.requests_per_second == 5.0
+            assert config.burst_capacity == 20
+            assert mock_logger.warning.call_count == 2
+
+        # The validated config builds limiters that can admit a request
+        assert SlidingWindowLimiter(config).try_acquire()
+
+    def test_algorithm_defaults_and_override(self, monkeypatch):
+        """Test that Bitbucket defaults to the sliding window and env overrides it."""
+        monkeypatch.delenv("ATLASSIAN_RATE_LIMIT_ALGORITHM", raising=False)
+        monkeypatch.delenv("BITBUCKET_RATE_LIMIT_ALGORITHM", raising=False)
+        assert get_config_from_env("jira").algorithm == "token_bucket"
+        assert get_config_from_env("bitbucket").algorithm == "sliding_window"
+
+        monkeypatch.setenv("BITBUCKET_RATE_LIMIT_ALGORITHM", "TOKEN_BUCKET")
+        assert get_config_from_env("bitbucket").algorithm == "token_bucket"
+
+        monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_ALGORITHM", "bogus")
+        with patch("mcp_atlassian.utils.rate_limit.logger") as mock_logger:
+            assert get_config_from_env("jira").algorithm == "token_bucket"
+            mock_logger.warning.assert_called_once()
+
 
 class TestTokenBucket:
     """Test the TokenBucket class."""
@@ -188,6 +232,28 @@ class TestTokenBucket:
         assert elapsed >= 0.01
         assert elapsed < 0.1
 
+    def test_concurrent_acquire_never_overdraws(self):
+        """Test that concurrent acquires never grant more than the burst."""
+        config = RateLimitConfig(burst_capacity=5, requests_per_second=100.0)
+        bucket = TokenBucket(config)
+        barrier = threading.Barrier(10)
+
+        def worker():
+            barrier.wait()
+            bucket.acquire()
+
+        start_time = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start_time
+
+        # 5 tokens are immediate; the other 5 need ~0.05s of refill at 100 RPS
+        assert elapsed >= 0.04
+        assert bucket.tokens < 1.0
+
     @pytest.mark.asyncio
     async def test_acquire_async(self):
         """Test async token acquisition."""
@@ -203,6 +269,71 @@ class TestTokenBucket:
         # Should have waited approximately 0.02s
         assert elapsed >= 0.01
 
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_async(self):
+        """Test that concurrent async acquires wait together without overdrawing."""
+        config = RateLimitConfig(burst_capacity=2, requests_per_second=100.0)
+        bucket = TokenBucket(config)
+
+        start_time = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+        elapsed = time.monotonic() - start_time
+
+        # 2 tokens are immediate; the other 4 need ~0.04s of refill at 100 RPS
+        assert elapsed >= 0.03
+        assert bucket.tokens < 1.0
+
+
+class TestSlidingWindowLimiter:
+    """Test the SlidingWindowLimiter class."""
+
+    def test_window_derived_from_config(self):
+        """Test that the window holds burst_capacity requests at the configured rate."""
+        config = RateLimitConfig(burst_capacity=10, requests_per_second=5.0)
+        limiter = SlidingWindowLimiter(config)
+        assert limiter.max_requests == 10
+        assert limiter.window == 2.0
+
+    def test_try_consume_until_full(self):
+        """Test that requests are admitted until the window is full."""
+        config = RateLimitConfig(burst_capacity=2, requests_per_second=1.0)
+        limiter = SlidingWindowLimiter(config)
+
+        assert limiter.try_consume(now=100.0) is True
+        assert limiter.try_consume(now=100.5) is True
+        assert limiter.try_consume(now=101.0) is False
+        # The first request leaves the window after 2 seconds
+        assert limiter.try_consume(now=102.0) is True
+
+    def test_rejected_request_is_not_recorded(self):
+        """Test that a rejected request does not consume a slot."""
+        config = RateLimitConfig(burst_capacity=1, requests_per_second=1.0)
+        limiter = SlidingWindowLimiter(config)
+
+        assert limiter.try_consume(now=10.0) is True
+        assert limiter.try_consume(now=10.5) is False
+        assert len(limiter._timestamps) == 1
+
+    def test_get_wait_time(self):
+        """Test that wait time is 0 with room and positive when full."""
+        config = RateLimitConfig(burst_capacity=1, requests_per_second=10.0)
+        limiter = SlidingWindowLimiter(config)
+
+        assert limiter.get_wait_time() == 0.0
+        assert limiter.try_acquire() is True
+        wait_time = limiter.get_wait_time()
+        assert 0 < wait_time <= 0.1
+
+    def test_acquire_waits_for_window(self):
+        """Test that acquire blocks until the oldest request expires."""
+        config = RateLimitConfig(burst_capacity=1, requests_per_second=50.0)
+        limiter = SlidingWindowLimiter(config)
+
+        limiter.acquire()
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.015
+
 
 class TestRateLimitedAdapter:
     """Test the RateLimitedAdapter class."""
@@ -341,20 +472,64 @@ class TestRateLimitedAdapter:
 
         assert adapter._parse_retry_after(response) is None
 
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("0.25", 0.25),
+            ("inf", None),
+            ("-1", None),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),  # already in the past
+        ],
+    )
+    def test_parse_retry_after_forms(self, header, expected):
+        """Test fractional seconds, rejected float spellings, and HTTP-dates."""
+        config = RateLimitConfig()
+        bucket = TokenBucket(config)
+        adapter = RateLimitedAdapter(bucket, config)
+
+        response = MagicMock(spec=Response)
+        response.headers = {"Retry-After": header}
+
+        assert adapter._parse_retry_after(response) == expected
+
 
 class TestRateLimiterRegistry:
-    """Test the RateLimiterRegistry singleton."""
+    """Test the RateLimiterRegistry."""
 
     def setup_method(self):
         """Reset the registry before each test."""
         registry = get_rate_limiter_registry()
         registry.reset()
 
-    def test_singleton_behavior(self):
-        """Test that registry is a singleton."""
-        registry1 = RateLimiterRegistry()
-        registry2 = RateLimiterRegistry()
-        assert registry1 is registry2
+    def test_global_registry_is_shared(self):
+        """Test that the global registry is the same instance on every call."""
+        assert get_rate_limiter_registry() is get_rate_limiter_registry()
+
+    def test_separate_registries_are_independent(self):
+        """Test that explicitly constructed registries do not share state."""
+        registry = RateLimiterRegistry()
+        assert registry is not get_rate_limiter_registry()
+        assert registry.get_limiter("jira") is not (
+            get_rate_limiter_registry().get_limiter("jira")
+        )
+
+    def test_concurrent_get_limiter_creates_one(self):
+        """Test that concurrent first lookups share a single limiter."""
+        registry = get_rate_limiter_registry()
+        barrier = threading.Barrier(8)
+        limiters = []
+
+        def worker():
+            barrier.wait()
+            limiters.append(registry.get_limiter("jira"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(limiter) for limiter in limiters}) == 1
 
     def test_get_limiter_creates_new(self):
         """Test that get_limiter creates a new limiter if not exists."""
@@ -383,6 +558,12 @@ class TestRateLimiterRegistry:
         confluence_limiter = registry.get_limiter("confluence")
         assert jira_limiter is not confluence_limiter
 
+    def test_configure_sliding_window(self):
+        """Test that the configured algorithm selects the limiter type."""
+        registry = get_rate_limiter_registry()
+        registry.configure("jira", RateLimitConfig(algorithm="sliding_window"))
+        assert isinstance(registry.get_limiter("jira"), SlidingWindowLimiter)
+
     def test_configure_service(self):
         """Test configuring a service with custom config."""
         registry = get_rate_limiter_registry()
@@ -416,6 +597,21 @@ class TestRateLimiterRegistry:
         limiter2 = registry.get_limiter("jira")
         assert limiter1 is not limiter2
 
+    def test_env_config_cached_until_reset(self, monkeypatch):
+        """Test that env config is parsed once and re-read after reset."""
+        registry = get_rate_limiter_registry()
+        monkeypatch.setenv("JIRA_RATE_LIMIT_RPS", "3.0")
+        assert registry.get_limiter("jira").config.requests_per_second == 3.0
+
+        monkeypatch.setenv("JIRA_RATE_LIMIT_RPS", "4.0")
+        session = MagicMock(spec=Session)
+        configure_rate_limiting(session, "jira")
+        adapter = session.mount.call_args[0][1]
+        assert adapter.config.requests_per_second == 3.0
+
+        registry.reset()
+        assert registry.get_limiter("jira").config.requests_per_second == 4.0
+
 
 class TestConfigureRateLimiting:
     """Test the configure_rate_limiting function."""
@@ -459,3 +655,16 @@ class TestConfigureRateLimiting:
         # Verify that a limiter was created in the registry
         limiter = registry.get_limiter("jira")
         assert limiter is not None
+
+    def test_pool_sizes_forwarded_to_adapter(self):
+        """Test that connection pool sizes are applied to the mounted adapter."""
+        session = Session()
+
+        configure_rate_limiting(
+            session, "bitbucket", pool_connections=4, pool_maxsize=8
+        )
+
+        adapter = session.get_adapter("https://example.com")
+        assert isinstance(adapter, RateLimitedAdapter)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 8